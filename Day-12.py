@@ -2,10 +2,187 @@
 # 📌 Password Generator
 # -----------------------------------------------
 
-# This program generates a strong random password based on user preferences.
+# This program generates strong random passwords based on user preferences.
+# Randomness comes from the operating system (os.urandom), which is
+# cryptographically secure, unlike the 'random' module.
 
-import random
+# Usage:
+#   python Day-12.py                                           -> interactive, one password
+#   python Day-12.py --count 1000000 --length 16 --out pw.txt  -> bulk generation to a file
+
+import argparse
+import os
+import secrets
 import string
+import time
+from bisect import bisect_right
+from math import comb
+
+# How many random bytes are requested from the OS at a time
+BLOCK_SIZE = 1 << 16
+
+# How many passwords are built per batch when generating in bulk
+BATCH_SIZE = 10000
+
+
+class PasswordPolicy:
+    """
+    Describes which characters a password may contain.
+    - use_digits: Whether to include numbers in the password
+    - use_special_chars: Whether to include special characters
+    - require_each: Whether every enabled character class must appear at least once
+    """
+
+    def __init__(self, use_digits=True, use_special_chars=True, require_each=True):
+        self.use_digits = use_digits
+        self.use_special_chars = use_special_chars
+        self.require_each = require_each
+
+    def character_classes(self):
+        """Return the enabled character sets (letters always come first)."""
+        classes = [string.ascii_letters]  # A-Z & a-z
+        if self.use_digits:
+            classes.append(string.digits)  # 0-9
+        if self.use_special_chars:
+            classes.append(string.punctuation)  # Special symbols
+        return classes
+
+
+class ByteSampler:
+    """
+    Turns blocks of OS randomness into unbiased picks from a fixed set of byte values.
+
+    Each random byte is mapped to a symbol with bytes.translate(). Bytes at or above the
+    largest multiple of len(symbols) are deleted (rejection sampling), so every symbol
+    is exactly equally likely, and no Python-level loop runs per character.
+    """
+
+    def __init__(self, symbols):
+        count = len(symbols)
+        if not 0 < count <= 256:
+            raise ValueError("a sampler needs between 1 and 256 symbols")
+        limit = 256 // count * count
+        self.table = bytes(symbols[b % count] if b < limit else 0 for b in range(256))
+        self.rejected = bytes(range(limit, 256))
+        self.buffer = b""
+        self.position = 0
+
+    def take(self, size):
+        """Return 'size' random symbols as a bytes object."""
+        while len(self.buffer) - self.position < size:
+            fresh = os.urandom(max(BLOCK_SIZE, 2 * size)).translate(self.table, self.rejected)
+            self.buffer = self.buffer[self.position:] + fresh
+            self.position = 0
+        result = self.buffer[self.position:self.position + size]
+        self.position += size
+        return result
+
+
+class ClassCountSampler:
+    """
+    Draws how many characters of each class a password gets.
+
+    A password that must contain every class is uniform over all valid
+    passwords only if each set of class counts comes up exactly as often as
+    valid passwords with those counts exist. The counts are drawn one class at
+    a time from exact (integer) weights.
+    """
+
+    def __init__(self, sizes, length):
+        self.sizes = sizes  # Number of characters in each class
+        self.length = length
+        self.tables = {}  # (class, characters left) -> cumulative weights of each count
+
+    def valid(self, first, length):
+        """Number of strings of 'length' over classes first.. that use every one of them."""
+        sizes = self.sizes[first:]
+        total = 0
+        for mask in range(1 << len(sizes)):  # Inclusion-exclusion over the missing classes
+            used = [size for bit, size in enumerate(sizes) if mask >> bit & 1]
+            total += (-1) ** (len(sizes) - len(used)) * sum(used) ** length
+        return total
+
+    def table(self, index, left):
+        """Cumulative weights of giving class 'index' 1, 2, ... of the 'left' characters."""
+        key = (index, left)
+        if key not in self.tables:
+            later = len(self.sizes) - index - 1  # Classes that still need a character each
+            cumulative, total = [], 0
+            for count in range(1, left - later + 1):
+                total += comb(left, count) * self.sizes[index] ** count * self.valid(index + 1, left - count)
+                cumulative.append(total)
+            self.tables[key] = cumulative
+        return self.tables[key]
+
+    def draw(self):
+        """Return one count per class, each at least 1, adding up to the length."""
+        counts, left = [], self.length
+        for index in range(len(self.sizes) - 1):
+            cumulative = self.table(index, left)
+            count = bisect_right(cumulative, secrets.randbelow(cumulative[-1])) + 1
+            counts.append(count)
+            left -= count
+        counts.append(left)
+        return counts
+
+
+def generate_passwords(count, length=12, policy=None):
+    """
+    Generator that yields 'count' random passwords of the given length.
+
+    Every password that satisfies the policy is equally likely. Passwords are
+    drawn uniformly from the whole alphabet; one that misses a required class
+    is not retried but replaced by a password built from exact class counts
+    (see ClassCountSampler). Keeping the valid draws and replacing the rest
+    with a uniform valid password gives every valid password the same chance.
+    """
+    if length < 0:
+        raise ValueError("length cannot be negative")
+    policy = policy or PasswordPolicy()
+    classes = policy.character_classes()
+    required = classes if policy.require_each else []
+    if length < len(required):
+        raise ValueError(f"length must be at least {len(required)} for this policy")
+
+    alphabet = ByteSampler("".join(classes).encode("ascii"))
+    # Maps every character to the number of its class, to see which classes a password uses
+    class_of = bytes.maketrans("".join(required).encode("ascii"),
+                               bytes(i for i, chars in enumerate(required) for _ in chars))
+    class_numbers = [bytes([i]) for i in range(len(required))]
+
+    if required:
+        counts = ClassCountSampler([len(chars) for chars in required], length)
+        class_samplers = [ByteSampler(chars.encode("ascii")) for chars in required]
+        # Partial Fisher-Yates over the positions: step 't' picks one of positions t .. length-1
+        step_samplers = [ByteSampler(bytes(range(length - t))) if length - t <= 256 else None
+                         for t in range(length)]
+
+    def replacement():
+        """A uniformly random valid password: letters, with the other classes at random positions."""
+        _, *other_counts = counts.draw()  # Letters are always the first class
+        password = bytearray(class_samplers[0].take(length))
+        extra = b"".join(sampler.take(k) for sampler, k in zip(class_samplers[1:], other_counts))
+        positions = list(range(length))
+        for t, char in enumerate(extra):
+            sampler = step_samplers[t]
+            j = t + (sampler.take(1)[0] if sampler else secrets.randbelow(length - t))
+            positions[t], positions[j] = positions[j], positions[t]
+            password[positions[t]] = char
+        return password
+
+    remaining = count
+    while remaining > 0:
+        batch = min(BATCH_SIZE, remaining)
+        remaining -= batch
+
+        body = alphabet.take(batch * length)
+        for n in range(batch):
+            password = body[n * length:(n + 1) * length]
+            used = password.translate(class_of)
+            if not all(number in used for number in class_numbers):
+                password = replacement()
+            yield password.decode("ascii")
+
 
 def generate_password(length=12, use_digits=True, use_special_chars=True):
     """
@@ -14,25 +191,63 @@ def generate_password(length=12, use_digits=True, use_special_chars=True):
     - use_digits: Whether to include numbers in the password
     - use_special_chars: Whether to include special characters
     """
-    # 🔹 Define character sets
-    letters = string.ascii_letters  # A-Z & a-z
-    digits = string.digits if use_digits else ""  # 0-9
-    special_chars = string.punctuation if use_special_chars else ""  # Special symbols
+    policy = PasswordPolicy(use_digits, use_special_chars)
+    # Only require one of each class when the password is long enough to hold them
+    policy.require_each = length >= len(policy.character_classes())
+    return next(generate_passwords(1, length, policy))
+
+
+def save_passwords(filename, count, length=12, policy=None):
+    """Stream 'count' passwords to a file, one per line, writing a batch at a time."""
+    passwords = generate_passwords(count, length, policy)
+    with open(filename, "w", encoding="ascii") as file:
+        written = 0
+        while written < count:
+            batch = min(BATCH_SIZE, count - written)
+            file.writelines(next(passwords) + "\n" for _ in range(batch))
+            written += batch
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate secure random passwords.")
+    parser.add_argument("--count", type=int, help="number of passwords to generate in bulk")
+    parser.add_argument("--length", type=int, default=12, help="password length")
+    parser.add_argument("--no-digits", action="store_true", help="leave out numbers")
+    parser.add_argument("--no-special", action="store_true", help="leave out special characters")
+    parser.add_argument("--out", default="passwords.txt", help="output file for bulk mode")
+    args = parser.parse_args()
 
-    # 🔹 Combine all selected character sets
-    all_chars = letters + digits + special_chars
+    # 🔹 Bulk mode
+    if args.count:
+        policy = PasswordPolicy(not args.no_digits, not args.no_special)
+        start = time.perf_counter()
+        try:
+            save_passwords(args.out, args.count, args.length, policy)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return
+        elapsed = time.perf_counter() - start
+        print(f"🛡️ {args.count} passwords written to {args.out} in {elapsed:.2f}s")
+        return
 
-    # 🔹 Generate password
-    password = "".join(random.choice(all_chars) for _ in range(length))
+    # 🔹 User Input
+    print("\n🔑 Password Generator")
+    try:
+        length = int(input("🔢 Enter password length (default: 12): ") or 12)
+    except ValueError:
+        print("❌ Please enter a whole number for the length.")
+        return
+    use_digits = input("🔄 Include numbers? (yes/no): ").strip().lower() == "yes"
+    use_special_chars = input("🔄 Include special characters? (yes/no): ").strip().lower() == "yes"
 
-    return password
+    # ✅ Generate and display the password
+    try:
+        generated_password = generate_password(length, use_digits, use_special_chars)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return
+    print(f"\n🛡️ Strong Password Generated: {generated_password}")
 
-# 🔹 User Input
-print("\n🔑 Password Generator")
-length = int(input("🔢 Enter password length (default: 12): ") or 12)
-use_digits = input("🔄 Include numbers? (yes/no): ").strip().lower() == "yes"
-use_special_chars = input("🔄 Include special characters? (yes/no): ").strip().lower() == "yes"
 
-# ✅ Generate and display the password
-generated_password = generate_password(length, use_digits, use_special_chars)
-print(f"\n🛡️ Strong Password Generated: {generated_password}")
+if __name__ == "__main__":
+    main()
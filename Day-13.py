@@ -2,44 +2,169 @@
 # 🧮 Body Mass Index (BMI) Calculator
 # -----------------------------------------------
 
-# Display a welcome message
-print("🌟 Welcome to the BMI Calculator!")
-print("📏 Please enter your height and weight to calculate your BMI.\n")
-
-# Get user's height in meters
-try:
-    height = float(input("🔹 Enter your height in meters (e.g., 1.75): "))
-except ValueError:
-    print("❌ Invalid input! Please enter a number for height.")
-    exit()
-
-# Get user's weight in kilograms
-try:
-    weight = float(input("🔹 Enter your weight in kilograms (e.g., 68): "))
-except ValueError:
-    print("❌ Invalid input! Please enter a number for weight.")
-    exit()
-
-# Check for valid positive values
-if height <= 0 or weight <= 0:
-    print("⚠️ Height and weight must be greater than zero.")
-    exit()
-
-# Calculate BMI using the formula: BMI = weight / (height^2)
-bmi = weight / (height ** 2)
-
-# Display the result with two decimal places
-print(f"\n📊 Your BMI is: {bmi:.2f}")
-
-# Determine the BMI category based on standard ranges
-if bmi < 18.5:
-    print("🟡 You are underweight.")
-elif 18.5 <= bmi < 24.9:
-    print("🟢 You have a normal weight.")
-elif 25 <= bmi < 29.9:
-    print("🟠 You are overweight.")
-else:
-    print("🔴 You are obese.")
-
-# Friendly closing message
-print("\n✅ Thank you for using the BMI Calculator. Stay healthy! 💪")
+# Usage:
+#   python Day-13.py                          -> calculate one BMI interactively
+#   python Day-13.py people.csv result.csv    -> annotate a whole CSV or Parquet file
+#   (optional: --height-col NAME --weight-col NAME, heights in meters, weights in kg)
+
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+# 📋 Single band table used for every classification: (lower bound, band, message)
+# Each band runs from its lower bound up to (but not including) the next one,
+# so there are no gaps between bands.
+BMI_BANDS = [
+    (0.0, "underweight", "🟡 You are underweight."),
+    (18.5, "normal", "🟢 You have a normal weight."),
+    (25.0, "overweight", "🟠 You are overweight."),
+    (30.0, "obese", "🔴 You are obese."),
+]
+BAND_EDGES = np.array([lower for lower, _, _ in BMI_BANDS[1:]])
+BAND_NAMES = [name for _, name, _ in BMI_BANDS]
+
+
+def calculate_bmi(height, weight):
+    """
+    Calculate BMI = weight / (height^2) for single values or whole NumPy arrays.
+    Rows with a missing or non-positive height or weight get NaN.
+    """
+    height = np.asarray(height, dtype=np.float64)
+    weight = np.asarray(weight, dtype=np.float64)
+    valid = (height > 0) & (weight > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(valid, weight / (height * height), np.nan)
+
+
+def classify_bmi(bmi):
+    """
+    Return the band index (into BMI_BANDS) for each BMI value, or -1 for NaN.
+    np.digitize looks every value up in BAND_EDGES without a Python loop.
+    """
+    bmi = np.asarray(bmi, dtype=np.float64)
+    codes = np.digitize(bmi, BAND_EDGES)
+    return np.where(np.isnan(bmi), -1, codes)
+
+
+def read_table(path):
+    """Read a CSV or Parquet file into a DataFrame."""
+    if path.lower().endswith(".parquet"):
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+
+def write_table(df, path):
+    """Write a DataFrame to CSV or Parquet depending on the file extension."""
+    if path.lower().endswith(".parquet"):
+        df.to_parquet(path, index=False)
+    else:
+        df.to_csv(path, index=False)
+
+
+def annotate_file(input_path, output_path, height_col="height", weight_col="weight"):
+    """
+    Add 'bmi' and 'band' columns to every row of a CSV/Parquet file.
+    Returns a dictionary of summary statistics.
+    """
+    df = read_table(input_path)
+    for column in (height_col, weight_col):
+        if column not in df.columns:
+            raise ValueError(f"column '{column}' not found in {input_path}")
+
+    heights = pd.to_numeric(df[height_col], errors="coerce").to_numpy(dtype=np.float64)
+    weights = pd.to_numeric(df[weight_col], errors="coerce").to_numpy(dtype=np.float64)
+
+    bmi = calculate_bmi(heights, weights)
+    codes = classify_bmi(bmi)
+
+    df["bmi"] = np.round(bmi, 2)
+    df["band"] = pd.Categorical.from_codes(codes, categories=BAND_NAMES)
+    write_table(df, output_path)
+
+    valid = ~np.isnan(bmi)
+    counts = np.bincount(codes[valid], minlength=len(BMI_BANDS))
+    return {
+        "rows": len(df),
+        "invalid_rows": int((~valid).sum()),
+        "mean_bmi": float(bmi[valid].mean()) if valid.any() else float("nan"),
+        "min_bmi": float(bmi[valid].min()) if valid.any() else float("nan"),
+        "max_bmi": float(bmi[valid].max()) if valid.any() else float("nan"),
+        "bands": dict(zip(BAND_NAMES, counts.tolist())),
+    }
+
+
+def print_summary(stats):
+    """Display the statistics returned by annotate_file."""
+    print(f"\n📊 Rows processed: {stats['rows']} ({stats['invalid_rows']} invalid)")
+    print(f"📈 BMI mean: {stats['mean_bmi']:.2f}  min: {stats['min_bmi']:.2f}  "
+          f"max: {stats['max_bmi']:.2f}")
+    for name, count in stats["bands"].items():
+        share = 100 * count / max(stats["rows"] - stats["invalid_rows"], 1)
+        print(f"   {name:<12} {count:>10}  ({share:.1f}%)")
+
+
+def run_interactive():
+    # Display a welcome message
+    print("🌟 Welcome to the BMI Calculator!")
+    print("📏 Please enter your height and weight to calculate your BMI.\n")
+
+    # Get user's height in meters
+    try:
+        height = float(input("🔹 Enter your height in meters (e.g., 1.75): "))
+    except ValueError:
+        print("❌ Invalid input! Please enter a number for height.")
+        return
+
+    # Get user's weight in kilograms
+    try:
+        weight = float(input("🔹 Enter your weight in kilograms (e.g., 68): "))
+    except ValueError:
+        print("❌ Invalid input! Please enter a number for weight.")
+        return
+
+    # Check for valid positive values
+    if height <= 0 or weight <= 0:
+        print("⚠️ Height and weight must be greater than zero.")
+        return
+
+    # Calculate BMI using the formula: BMI = weight / (height^2)
+    bmi = float(calculate_bmi(height, weight))
+
+    # Display the result with two decimal places
+    print(f"\n📊 Your BMI is: {bmi:.2f}")
+
+    # Determine the BMI category from the band table
+    print(BMI_BANDS[int(classify_bmi(bmi))][2])
+
+    # Friendly closing message
+    print("\n✅ Thank you for using the BMI Calculator. Stay healthy! 💪")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Calculate BMI for one person or a whole file.")
+    parser.add_argument("input", nargs="?", help="CSV or Parquet file with height/weight columns")
+    parser.add_argument("output", nargs="?", help="where to write the annotated file")
+    parser.add_argument("--height-col", default="height", help="height column (meters)")
+    parser.add_argument("--weight-col", default="weight", help="weight column (kilograms)")
+    args = parser.parse_args()
+
+    if not args.input:
+        run_interactive()
+        return
+
+    output = args.output or "bmi_" + os.path.basename(args.input)
+    start = time.perf_counter()
+    try:
+        stats = annotate_file(args.input, output, args.height_col, args.weight_col)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        return
+    print(f"✅ Annotated file written to {output} in {time.perf_counter() - start:.2f}s")
+    print_summary(stats)
+
+
+if __name__ == "__main__":
+    main()
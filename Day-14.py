@@ -2,26 +2,112 @@
 # 📆 Leap Year Checker in Python
 # -----------------------------------------------
 
-# Display a welcome message
-print("🌟 Welcome to the Leap Year Checker!")
-print("🔎 Enter a year to check whether it is a leap year or not.\n")
-
-# Ask the user to input a year
-try:
-    year = int(input("🔹 Enter a year (e.g., 2024): "))
-except ValueError:
-    print("❌ Invalid input! Please enter a valid integer year.")
-    exit()
-
-# ✅ Logic for leap year:
-# A year is a leap year if:
-# 1. It is divisible by 4 AND
-# 2. Not divisible by 100, UNLESS it is also divisible by 400
-
-if (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0):
-    print(f"✅ Yes! {year} is a leap year. 🎉")
-else:
-    print(f"❌ No, {year} is not a leap year.")
-
-# Friendly closing message
-print("\n📘 Tip: Leap years occur every 4 years to help align our calendar with Earth's orbit.")
+# Besides checking a single year, this file provides batch helpers that work on
+# whole NumPy arrays and closed-form formulas that count leap years and days
+# between dates without looping over the years in between.
+
+import datetime
+
+import numpy as np
+
+# Days in the year before the first day of each month (non-leap year)
+DAYS_BEFORE_MONTH = np.array([0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334])
+
+
+def is_leap(year):
+    """
+    ✅ Logic for leap year:
+    A year is a leap year if:
+    1. It is divisible by 4 AND
+    2. Not divisible by 100, UNLESS it is also divisible by 400
+    """
+    return (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0)
+
+
+def is_leap_many(years):
+    """
+    Vectorised is_leap: takes a list or NumPy array of years and
+    returns a boolean NumPy array, without a Python call per year.
+    """
+    years = np.asarray(years)
+    return (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+
+
+def leap_years_up_to(year):
+    """
+    Number of leap years from year 1 up to and including 'year' (Gregorian rules).
+    Works for ints and NumPy arrays alike.
+    """
+    return year // 4 - year // 100 + year // 400
+
+
+def leap_years_between(a, b):
+    """
+    Number of leap years in the inclusive range [a, b], computed in O(1)
+    from the closed-form count instead of looping over the years.
+    """
+    low, high = np.minimum(a, b), np.maximum(a, b)
+    count = leap_years_up_to(high) - leap_years_up_to(low - 1)
+    return int(count) if np.ndim(count) == 0 else count
+
+
+def _to_ymd(value):
+    """Turn a date, an ISO 'YYYY-MM-DD' string or a (year, month, day) tuple into a tuple."""
+    if isinstance(value, str):
+        value = datetime.date.fromisoformat(value)
+    if isinstance(value, datetime.date):
+        return value.year, value.month, value.day
+    year, month, day = value
+    return np.asarray(year), np.asarray(month), np.asarray(day)
+
+
+def day_number(year, month, day):
+    """
+    Days since 0001-01-01 (day 1) for a date, using the same leap-year formulas.
+    'year', 'month' and 'day' may be ints or NumPy arrays of the same shape.
+    """
+    previous = year - 1
+    days = 365 * previous + leap_years_up_to(previous)
+    days = days + DAYS_BEFORE_MONTH[np.asarray(month) - 1] + day
+    # February 29th shifts every later month by one day in leap years
+    return days + (is_leap_many(year) & (np.asarray(month) > 2))
+
+
+def days_between(date_a, date_b):
+    """
+    Number of days from date_a to date_b (negative if date_b is earlier).
+    Each date may be a datetime.date, an ISO string or a (year, month, day)
+    tuple whose parts are NumPy arrays, to process many dates at once.
+    """
+    result = day_number(*_to_ymd(date_b)) - day_number(*_to_ymd(date_a))
+    return int(result) if np.ndim(result) == 0 else result
+
+
+def main():
+    # Display a welcome message
+    print("🌟 Welcome to the Leap Year Checker!")
+    print("🔎 Enter a year to check whether it is a leap year or not.\n")
+
+    # Ask the user to input a year
+    try:
+        year = int(input("🔹 Enter a year (e.g., 2024): "))
+    except ValueError:
+        print("❌ Invalid input! Please enter a valid integer year.")
+        return
+
+    if is_leap(year):
+        print(f"✅ Yes! {year} is a leap year. 🎉")
+    else:
+        print(f"❌ No, {year} is not a leap year.")
+
+    # Bonus fact using the closed-form count
+    this_year = datetime.date.today().year
+    print(f"📊 There are {leap_years_between(year, this_year)} leap years between "
+          f"{min(year, this_year)} and {max(year, this_year)} (inclusive).")
+
+    # Friendly closing message
+    print("\n📘 Tip: Leap years occur every 4 years to help align our calendar with Earth's orbit.")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,9 +2,17 @@
 # 🔢 Number to Words Converter in Python
 # -----------------------------------------------
 
-# Display a welcome message
-print("🌟 Welcome to the Number to Words Converter!")
-print("🔎 Enter a number (0 to 9999) to see it in words.\n")
+# Converts numbers of any size, negatives and decimals to English words,
+# e.g. -1234.5 -> "minus one thousand two hundred and thirty-four point five".
+
+# Usage:
+#   python Day-15.py                                  -> interactive converter
+#   python Day-15.py invoices.csv out.csv amount      -> add an "amount_words" column to a CSV
+#                                                        (bad rows go to out.csv.rejected.csv)
+
+import csv
+import sys
+from decimal import Decimal, InvalidOperation
 
 # Define word mappings for basic numbers
 units = ["zero", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
@@ -13,52 +21,187 @@ teens = ["ten", "eleven", "twelve", "thirteen", "fourteen", "fifteen",
 tens = ["", "", "twenty", "thirty", "forty", "fifty", 
         "sixty", "seventy", "eighty", "ninety"]
 
-# Function to convert number to words
-def number_to_words(num):
-    if num < 0 or num > 9999:
-        return "❌ Please enter a number between 0 and 9999."
-    
-    # Handle zero
+# Names of each group of three digits, from the right
+scales = ["", "thousand", "million", "billion", "trillion", "quadrillion",
+          "quintillion", "sextillion", "septillion", "octillion", "nonillion",
+          "decillion", "undecillion", "duodecillion", "tredecillion",
+          "quattuordecillion", "quindecillion", "sexdecillion", "septendecillion",
+          "octodecillion", "novemdecillion", "vigintillion"]
+
+
+def _below_hundred(num):
+    """Words for 0-99 (used only to build the chunk table)."""
+    if num < 10:
+        return units[num]
+    if num < 20:
+        return teens[num - 10]
+    if num % 10 == 0:
+        return tens[num // 10]
+    return tens[num // 10] + "-" + units[num % 10]  # Add hyphen for numbers like 42
+
+
+def _build_chunk_table():
+    """Precompute the words for every 3-digit chunk 0-999 once."""
+    table = []
+    for num in range(1000):
+        hundreds, rest = divmod(num, 100)
+        if hundreds and rest:
+            table.append(f"{units[hundreds]} hundred and {_below_hundred(rest)}")
+        elif hundreds:
+            table.append(f"{units[hundreds]} hundred")
+        else:
+            table.append(_below_hundred(rest))
+    return table
+
+
+chunk_words = _build_chunk_table()
+
+
+def _integer_to_words(num):
+    """Convert a non-negative integer of any size to words."""
     if num == 0:
         return "zero"
-    
-    words = ""
-
-    # Extract thousands place
-    if num >= 1000:
-        words += units[num // 1000] + " thousand "
-        num %= 1000
-
-    # Extract hundreds place
-    if num >= 100:
-        words += units[num // 100] + " hundred "
-        num %= 100
-
-    # Add "and" if number is not a multiple of 100 and higher place exists
-    if words != "" and num != 0:
-        words += "and "
-
-    # Handle numbers between 10 and 19
-    if 10 <= num < 20:
-        words += teens[num - 10]
+
+    digits = str(num)
+    # Beyond the largest scale name, split off the top part and name it recursively
+    top_groups = len(scales)
+    if len(digits) > 3 * top_groups:
+        cut = len(digits) - 3 * (top_groups - 1)
+        high, low = int(digits[:cut]), int(digits[cut:])
+        words = f"{_integer_to_words(high)} {scales[-1]}"
+        if low:
+            words += (" and " if low < 100 else " ") + _integer_to_words(low)
+        return words
+
+    # Pad to a multiple of 3 and read the digits one 3-digit chunk at a time
+    digits = digits.zfill((len(digits) + 2) // 3 * 3)
+    group_count = len(digits) // 3
+    parts = []
+    for i in range(group_count):
+        chunk = int(digits[3 * i:3 * i + 3])
+        if chunk:
+            scale = scales[group_count - 1 - i]
+            parts.append(f"{chunk_words[chunk]} {scale}" if scale else chunk_words[chunk])
+
+    # Add "and" if the last chunk is below 100 and a higher place exists
+    last = int(digits[-3:])
+    if len(parts) > 1 and 0 < last < 100:
+        parts[-1] = "and " + parts[-1]
+
+    return " ".join(parts)
+
+
+# Function to convert number to words
+def number_to_words(num):
+    """
+    Convert an int, Decimal, float or numeric string to words.
+    Decimal places are read digit by digit after "point".
+    Raises ValueError if 'num' is not a number.
+    """
+    if isinstance(num, int):
+        return "minus " + _integer_to_words(-num) if num < 0 else _integer_to_words(num)
+
+    # Strings and Decimals keep their exact digits; floats use their shortest repr
+    text = repr(num) if isinstance(num, float) else str(num).strip()
+    try:
+        value = Decimal(text)
+    except InvalidOperation:
+        raise ValueError(f"not a number: {num!r}")
+    if not value.is_finite():
+        raise ValueError(f"not a finite number: {num!r}")
+
+    sign, digit_tuple, exponent = value.as_tuple()
+    digits = "".join(map(str, digit_tuple))
+    if exponent >= 0:
+        whole, fraction = digits + "0" * exponent, ""
     else:
-        # Handle tens place
-        if num >= 20:
-            words += tens[num // 10]
-            if num % 10 != 0:
-                words += "-" + units[num % 10]  # Add hyphen for numbers like 42
-        elif num > 0:
-            words += units[num]
-
-    return words.strip()
-
-# Input from user
-try:
-    number = int(input("🔹 Enter a number (0 to 9999): "))
-    # Convert and display the result
-    print(f"\n📝 In words: {number_to_words(number)}")
-except ValueError:
-    print("❌ Invalid input! Please enter a valid whole number.")
-
-# Closing message
-print("\n✅ Thank you for using the converter. Have a great day! 🚀")
+        digits = digits.zfill(-exponent + 1)
+        whole, fraction = digits[:exponent], digits[exponent:]
+
+    words = _integer_to_words(int(whole))
+    if fraction:
+        words += " point " + " ".join(units[int(d)] for d in fraction)
+    if sign and (int(whole) or fraction.strip("0")):
+        words = "minus " + words
+    return words
+
+
+def numbers_to_words(numbers):
+    """Convert every number from an iterable; returns a list of strings."""
+    convert = number_to_words
+    return [convert(num) for num in numbers]
+
+
+def convert_csv(input_path, output_path, column, rejects_path=None):
+    """
+    Stream a CSV file and write a copy with an extra '<column>_words' column.
+    Rows are processed one at a time, so files with millions of rows are fine.
+    Rows whose value is not a number (or that have too many fields) are copied
+    to 'rejects_path' (default: <output>.rejected.csv) instead.
+    Returns (converted rows, rejected rows).
+    """
+    rejects_path = rejects_path or output_path + ".rejected.csv"
+    with open(input_path, newline="", encoding="utf-8") as source, \
+            open(output_path, "w", newline="", encoding="utf-8") as target:
+        reader = csv.DictReader(source)
+        if column not in (reader.fieldnames or []):
+            raise ValueError(f"column '{column}' not found in {input_path}")
+
+        writer = csv.DictWriter(target, fieldnames=reader.fieldnames + [f"{column}_words"])
+        writer.writeheader()
+        rejects = None  # Opened on the first bad row
+        converted = rejected = 0
+        try:
+            for row in reader:
+                try:
+                    if None in row:  # More fields than the header
+                        raise ValueError("too many fields")
+                    row[f"{column}_words"] = number_to_words(row[column])
+                except ValueError:
+                    if rejects is None:
+                        rejects = open(rejects_path, "w", newline="", encoding="utf-8")
+                        reject_writer = csv.writer(rejects)
+                        reject_writer.writerow(reader.fieldnames)
+                    reject_writer.writerow([row[name] for name in reader.fieldnames if row[name] is not None]
+                                           + row.get(None, []))
+                    rejected += 1
+                    continue
+                writer.writerow(row)
+                converted += 1
+        finally:
+            if rejects is not None:
+                rejects.close()
+    return converted, rejected
+
+
+def main():
+    # CSV column mode
+    if len(sys.argv) == 4:
+        input_path, output_path, column = sys.argv[1:]
+        try:
+            rows, rejected = convert_csv(input_path, output_path, column)
+            print(f"✅ Converted {rows} rows into {output_path}")
+            if rejected:
+                print(f"⚠️ {rejected} rows without a valid number were written to {output_path}.rejected.csv")
+        except (OSError, ValueError) as e:
+            print(f"❌ {e}")
+        return
+
+    # Display a welcome message
+    print("🌟 Welcome to the Number to Words Converter!")
+    print("🔎 Enter any number (e.g. 42, -1000000, 3.75) to see it in words.\n")
+
+    # Input from user
+    try:
+        number = input("🔹 Enter a number: ")
+        # Convert and display the result
+        print(f"\n📝 In words: {number_to_words(number)}")
+    except ValueError:
+        print("❌ Invalid input! Please enter a valid number.")
+
+    # Closing message
+    print("\n✅ Thank you for using the converter. Have a great day! 🚀")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,43 +2,205 @@
 # 💰 Tip Calculator in Python
 # -----------------------------------------------
 
-# Display a welcome message
-print("🌟 Welcome to the Tip Calculator!")
-print("🧾 Let's help you calculate how much tip to leave.\n")
-
-# Get user input for bill amount
-try:
-    bill_amount = float(input("🔹 Enter the total bill amount ($): "))
-except ValueError:
-    print("❌ Invalid input! Please enter a valid number for the bill.")
-    exit()
-
-# Get user input for tip percentage
-try:
-    tip_percentage = float(input("🔹 Enter the tip percentage you'd like to give (e.g., 15): "))
-except ValueError:
-    print("❌ Invalid input! Please enter a valid number for the tip percentage.")
-    exit()
-
-# Get user input for number of people sharing the bill
-try:
-    people = int(input("🔹 How many people are splitting the bill? "))
+# All money is handled in whole cents (integers), so splitting a bill never
+# loses or invents a cent: the leftover cents go to the first people, one each.
+
+# Usage:
+#   python Day-17.py                          -> interactive calculator
+#   python Day-17.py receipts.csv out.csv     -> settle a whole CSV of receipts
+#   (the CSV needs the columns: bill, tip_percent, people; rows with missing
+#   or invalid values go to out.csv.rejected.csv)
+
+import sys
+import time
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+
+import numpy as np
+import pandas as pd
+
+
+def to_cents(amount):
+    """Convert a dollar amount (string, int, float or Decimal) to integer cents."""
+    try:
+        value = Decimal(str(amount).strip())
+        if not value.is_finite():
+            raise ValueError(f"invalid amount: {amount!r}")
+        return int((value * 100).quantize(Decimal("1"), rounding=ROUND_HALF_UP))
+    except InvalidOperation:
+        raise ValueError(f"invalid amount: {amount!r}")
+
+
+# Sign, whole part and fraction of a plain decimal such as "-12.345"
+AMOUNT_PATTERN = r"^\s*([+-]?)(\d{0,15})(?:\.(\d*))?\s*$"
+
+
+def column_to_cents(column):
+    """
+    Exact, vectorised to_cents() for a column of strings: the whole and
+    fractional digits are converted separately, with no float rounding.
+    Returns (int64 cents, bool mask of valid cells). Blank cells are invalid.
+    """
+    parts = column.astype("string").str.extract(AMOUNT_PATTERN)
+    whole = parts[1].fillna("")
+    fraction = parts[2].fillna("")
+    valid = (parts[1].notna() & ((whole.str.len() > 0) | (fraction.str.len() > 0))).to_numpy(dtype=bool)
+
+    whole_cents = whole.where(whole != "", "0").where(valid, "0").astype(np.int64).to_numpy() * 100
+    digits = fraction.str.pad(3, side="right", fillchar="0").where(valid, "000")
+    fraction_cents = digits.str[:2].astype(np.int64).to_numpy()
+    round_up = (digits.str[2] >= "5").to_numpy(dtype=bool)  # Half-up on the third decimal
+    cents = whole_cents + fraction_cents + round_up
+    cents = np.where((parts[0] == "-").to_numpy(dtype=bool, na_value=False), -cents, cents)
+    return cents.astype(np.int64), valid
+
+
+def format_cents(cents):
+    """Format integer cents as a dollar string, e.g. 1234 -> '12.34'."""
+    sign = "-" if cents < 0 else ""
+    return f"{sign}{abs(cents) // 100}.{abs(cents) % 100:02d}"
+
+
+def split_cents(total_cents, people):
+    """
+    Split an amount in cents between 'people' as evenly as possible.
+    The first (total % people) people pay one cent more, so the shares
+    always add up exactly to the total.
+    """
     if people <= 0:
-        raise ValueError
-except ValueError:
-    print("❌ Invalid input! Number of people must be a positive whole number.")
-    exit()
-
-# Calculate tip and total
-tip_amount = (tip_percentage / 100) * bill_amount
-total_amount = bill_amount + tip_amount
-amount_per_person = total_amount / people
-
-# Display results
-print("\n🧮 Calculation Result:")
-print(f"💵 Tip Amount: ${tip_amount:.2f}")
-print(f"💰 Total Bill (with tip): ${total_amount:.2f}")
-print(f"👥 Each person pays: ${amount_per_person:.2f}")
-
-# Closing message
-print("\n✅ Thank you for using the Tip Calculator! Enjoy your meal! 🍽️")
+        raise ValueError("number of people must be positive")
+    base, remainder = divmod(total_cents, people)
+    return [base + 1] * remainder + [base] * (people - remainder)
+
+
+def settle_bill(bill_cents, tip_percentage, people):
+    """
+    Calculate the tip, total and each person's share for one bill.
+    'tip_percentage' may have decimals (e.g. "12.5"); the tip is rounded half-up to a cent.
+    Returns (tip_cents, total_cents, list of shares in cents).
+    """
+    tip_basis_points = to_cents(tip_percentage)  # 15% -> 1500 basis points
+    tip_cents = (bill_cents * tip_basis_points + 5000) // 10000
+    total_cents = bill_cents + tip_cents
+    return tip_cents, total_cents, split_cents(total_cents, people)
+
+
+def settle_batch(bill_cents, tip_basis_points, people):
+    """
+    Vectorised settle_bill over NumPy int64 arrays (one element per receipt).
+    Returns a dictionary of arrays: tip, total, the lower share, and how many
+    people pay one extra cent. share * people + extra_cent_people == total.
+    """
+    bill_cents = np.asarray(bill_cents, dtype=np.int64)
+    tip_basis_points = np.asarray(tip_basis_points, dtype=np.int64)
+    people = np.asarray(people, dtype=np.int64)
+    if (people <= 0).any():
+        raise ValueError("number of people must be positive on every receipt")
+
+    tip_cents = (bill_cents * tip_basis_points + 5000) // 10000
+    total_cents = bill_cents + tip_cents
+    share_cents, extra_cent_people = np.divmod(total_cents, people)
+    return {
+        "tip_cents": tip_cents,
+        "total_cents": total_cents,
+        "share_cents": share_cents,
+        "extra_cent_people": extra_cent_people,
+    }
+
+
+def settle_csv(input_path, output_path, rejects_path=None):
+    """
+    Settle every receipt in a CSV (columns: bill, tip_percent, people) and write
+    the results as integer-cent columns. Rows with a missing or invalid value are
+    copied to 'rejects_path' (default: <output>.rejected.csv) instead.
+    Returns (settled receipts, rejected receipts).
+    """
+    df = pd.read_csv(input_path, dtype=str)
+    for column in ("bill", "tip_percent", "people"):
+        if column not in df.columns:
+            raise ValueError(f"column '{column}' not found in {input_path}")
+
+    # Amounts are converted from their text exactly, never through float
+    bill_cents, bill_ok = column_to_cents(df["bill"])
+    tip_basis_points, tip_ok = column_to_cents(df["tip_percent"])
+    people_text = df["people"].astype("string").str.strip()
+    people_ok = people_text.str.fullmatch(r"\d{1,9}").to_numpy(dtype=bool, na_value=False)
+    people = np.where(people_ok, people_text.where(people_ok, "0").astype(np.int64).to_numpy(), 0)
+    valid = bill_ok & tip_ok & people_ok & (people > 0)
+
+    rejects_path = rejects_path or output_path + ".rejected.csv"
+    rejected = df[~valid]
+    if len(rejected):
+        rejected.to_csv(rejects_path, index=False)
+
+    settled = df[valid].copy()
+    results = settle_batch(bill_cents[valid], tip_basis_points[valid], people[valid])
+    for name, values in results.items():
+        settled[name] = values
+    settled.to_csv(output_path, index=False)
+    return len(settled), len(rejected)
+
+
+def run_interactive():
+    # Display a welcome message
+    print("🌟 Welcome to the Tip Calculator!")
+    print("🧾 Let's help you calculate how much tip to leave.\n")
+
+    # Get user input for bill amount
+    try:
+        bill_cents = to_cents(input("🔹 Enter the total bill amount ($): "))
+    except ValueError:
+        print("❌ Invalid input! Please enter a valid number for the bill.")
+        return
+
+    # Get user input for tip percentage
+    tip_percentage = input("🔹 Enter the tip percentage you'd like to give (e.g., 15): ")
+    try:
+        to_cents(tip_percentage)
+    except ValueError:
+        print("❌ Invalid input! Please enter a valid number for the tip percentage.")
+        return
+
+    # Get user input for number of people sharing the bill
+    try:
+        people = int(input("🔹 How many people are splitting the bill? "))
+        if people <= 0:
+            raise ValueError
+    except ValueError:
+        print("❌ Invalid input! Number of people must be a positive whole number.")
+        return
+
+    # Calculate tip, total and shares in whole cents
+    tip_cents, total_cents, shares = settle_bill(bill_cents, tip_percentage, people)
+
+    # Display results
+    print("\n🧮 Calculation Result:")
+    print(f"💵 Tip Amount: ${format_cents(tip_cents)}")
+    print(f"💰 Total Bill (with tip): ${format_cents(total_cents)}")
+    if shares[0] == shares[-1]:
+        print(f"👥 Each person pays: ${format_cents(shares[0])}")
+    else:
+        extra = shares.count(shares[0])
+        print(f"👥 {extra} person(s) pay ${format_cents(shares[0])}, "
+              f"{people - extra} pay ${format_cents(shares[-1])}")
+
+    # Closing message
+    print("\n✅ Thank you for using the Tip Calculator! Enjoy your meal! 🍽️")
+
+
+def main():
+    if len(sys.argv) == 3:
+        start = time.perf_counter()
+        try:
+            rows, rejected = settle_csv(sys.argv[1], sys.argv[2])
+        except (OSError, ValueError) as e:
+            print(f"❌ {e}")
+            return
+        print(f"✅ Settled {rows} receipts into {sys.argv[2]} in {time.perf_counter() - start:.2f}s")
+        if rejected:
+            print(f"⚠️ {rejected} receipts had missing or invalid values; see {sys.argv[2]}.rejected.csv")
+    else:
+        run_interactive()
+
+
+if __name__ == "__main__":
+    main()
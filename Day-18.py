@@ -2,22 +2,25 @@
 # ✍️ Mad Libs Generator in Python
 # -----------------------------------------------
 
-# Display a welcome message
-print("🌟 Welcome to the Mad Libs Generator!")
-print("🧠 Fill in the blanks to create your own funny story.\n")
-
-# Prompt the user for various words
-# Each input will be used in the story template
-adjective = input("🔹 Enter an adjective: ")
-noun = input("🔹 Enter a noun: ")
-verb = input("🔹 Enter a verb (past tense): ")
-place = input("🔹 Enter a place: ")
-adverb = input("🔹 Enter an adverb: ")
-emotion = input("🔹 Enter an emotion: ")
-animal = input("🔹 Enter an animal: ")
-
-# 📝 Story template with placeholders
-story = f"""
+# Story templates use named placeholders like {adjective}. Each template is
+# compiled once into its static text fragments and the slots between them,
+# so rendering a story is just writing those pieces out in order.
+
+# Usage:
+#   python Day-18.py                                            -> play interactively
+#   python Day-18.py --words words.csv --out stories.txt        -> render many stories
+#   (add --template story.txt to use your own template; word sets may be CSV or JSONL)
+
+import argparse
+import csv
+import io
+import json
+import os
+import re
+import time
+
+# 📝 Default story template with placeholders
+DEFAULT_TEMPLATE = """
 😄 Here's your Mad Libs story:
 
 One day, a very {adjective} {noun} {verb} into a {place}.
@@ -27,9 +30,152 @@ Suddenly, a giant {animal} appeared and started dancing! 💃
 The end. 🎬
 """
 
-# Display the final story
-print("\n🎉 Your Generated Mad Libs Story:")
-print(story)
+# Friendly prompts for the default placeholders
+PROMPTS = {
+    "adjective": "an adjective",
+    "noun": "a noun",
+    "verb": "a verb (past tense)",
+    "place": "a place",
+    "adverb": "an adverb",
+    "emotion": "an emotion",
+    "animal": "an animal",
+}
+
+PLACEHOLDER_PATTERN = re.compile(r"\{(\w+)\}")
+
+
+class CompiledTemplate:
+    """A story template split into static fragments and numbered slots."""
+
+    def __init__(self, text):
+        parts = PLACEHOLDER_PATTERN.split(text)
+        # Even parts are static text, odd parts are placeholder names
+        self.fragments = parts[0::2]
+        names = parts[1::2]
+        # Each distinct placeholder gets one field index, in order of appearance
+        self.fields = list(dict.fromkeys(names))
+        index = {name: i for i, name in enumerate(self.fields)}
+        self.slots = [index[name] for name in names]
+
+    def values_from(self, words):
+        """
+        Turn a {placeholder: word} mapping into a tuple of strings ordered like
+        self.fields. Non-string words (e.g. numbers from JSONL) are converted
+        with str(); missing or None words raise ValueError.
+        """
+        values = []
+        for name in self.fields:
+            word = words.get(name)
+            if word is None:  # Absent key, short CSV row or JSON null
+                raise ValueError(f"missing word for placeholder '{name}'")
+            values.append(word if isinstance(word, str) else str(word))
+        return tuple(values)
+
+    def render_to(self, out, values):
+        """Write one story to a file-like object, given a tuple from values_from()."""
+        pieces = [None] * (2 * len(self.fragments) - 1)
+        pieces[0::2] = self.fragments
+        pieces[1::2] = [values[slot] for slot in self.slots]
+        out.writelines(pieces)
+
+    def render(self, words):
+        """Return one story as a string."""
+        buffer = io.StringIO()
+        self.render_to(buffer, self.values_from(words))
+        return buffer.getvalue()
+
+
+# Compiled templates, keyed by file path: path -> (modification time, template)
+_template_cache = {}
+
+
+def load_template(path):
+    """
+    Load and compile a template file, reusing the compiled version
+    until the file is modified.
+    """
+    mtime = os.stat(path).st_mtime_ns
+    cached = _template_cache.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    with open(path, "r", encoding="utf-8") as file:
+        template = CompiledTemplate(file.read())
+    _template_cache[path] = (mtime, template)
+    return template
+
+
+def read_word_sets(path):
+    """Yield one {placeholder: word} dictionary per row of a CSV or JSONL file."""
+    with open(path, "r", encoding="utf-8", newline="") as file:
+        if path.lower().endswith((".jsonl", ".json")):
+            for line in file:
+                if line.strip():
+                    words = json.loads(line)
+                    if not isinstance(words, dict):
+                        raise ValueError(f"each JSONL line must be an object, got: {line.strip()[:40]}")
+                    yield words
+        else:
+            yield from csv.DictReader(file)
+
+
+def render_batch(template, word_sets, out, separator="\n" + "-" * 40 + "\n"):
+    """Render one story per word set straight into 'out'. Returns the number of stories."""
+    count = 0
+    for words in word_sets:
+        if count:
+            out.write(separator)
+        try:
+            values = template.values_from(words)
+        except ValueError as e:
+            raise ValueError(f"word set {count + 1}: {e}") from None
+        template.render_to(out, values)
+        count += 1
+    return count
+
+
+def run_interactive(template):
+    # Display a welcome message
+    print("🌟 Welcome to the Mad Libs Generator!")
+    print("🧠 Fill in the blanks to create your own funny story.\n")
+
+    # Prompt the user for each placeholder of the template
+    words = {}
+    for name in template.fields:
+        prompt = PROMPTS.get(name, "a " + name.replace("_", " "))
+        words[name] = input(f"🔹 Enter {prompt}: ")
+
+    # Display the final story
+    print("\n🎉 Your Generated Mad Libs Story:")
+    print(template.render(words))
+
+    # Closing message
+    print("✅ Thanks for playing Mad Libs! Try again for a different story! 🚀")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mad Libs story generator.")
+    parser.add_argument("--template", help="story template file with {placeholders}")
+    parser.add_argument("--words", help="CSV or JSONL file with one word set per row")
+    parser.add_argument("--out", default="stories.txt", help="output file for batch mode")
+    args = parser.parse_args()
+
+    template = load_template(args.template) if args.template else CompiledTemplate(DEFAULT_TEMPLATE)
+
+    if not args.words:
+        run_interactive(template)
+        return
+
+    start = time.perf_counter()
+    try:
+        with open(args.out, "w", encoding="utf-8") as out:
+            count = render_batch(template, read_word_sets(args.words), out)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        return
+    elapsed = time.perf_counter() - start
+    print(f"✅ Rendered {count} stories into {args.out} in {elapsed:.2f}s")
+
 
-# Closing message
-print("✅ Thanks for playing Mad Libs! Try again for a different story! 🚀")
+if __name__ == "__main__":
+    main()
@@ -2,12 +2,284 @@
 # 🏦 Mini Banking System in Python
 # -----------------------------------------------
 
-# Initialize user's bank balance
-balance = 0.0
+# Balances are kept in whole cents in a Ledger that survives restarts:
+# - every transaction is appended to a write-ahead log (WAL) on disk,
+#   one checksummed line per record,
+# - the log is fsync'ed in batches, not once per transaction,
+# - a snapshot of all balances is written every so often, so startup only
+#   replays the log written after the last snapshot,
+# - each account has its own lock, so many threads can work at once.
+
+# Usage:
+#   python Day-19.py          -> interactive banking menu
+#   python Day-19.py bench    -> 16-thread throughput benchmark
+
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+import zlib
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+
+
+class InsufficientFundsError(ValueError):
+    """Raised when a withdrawal is larger than the account balance."""
+
+
+class Ledger:
+    """Persistent, thread-safe set of accounts with integer-cent balances."""
+
+    def __init__(self, folder="bank_data", sync_every=256, snapshot_every=100000):
+        self.folder = folder
+        self.sync_every = sync_every  # fsync the log after this many records
+        self.snapshot_every = snapshot_every  # snapshot after this many records
+        self.balances = {}  # account id -> balance in cents
+        self.locks = {}  # account id -> threading.Lock
+        self.accounts_lock = threading.Lock()  # guards creating accounts
+        self.log_lock = threading.Lock()  # guards the log file and the sequence number
+        self.snapshot_lock = threading.Lock()  # only one snapshot at a time
+        self.seq = 0  # sequence number of the last logged transaction
+        self.unsynced = 0
+        self.since_snapshot = 0
+
+        os.makedirs(folder, exist_ok=True)
+        self._recover()
+        self.log = open(self._segment_path(self.seq + 1), "a", encoding="utf-8")
+
+    # ---------- files ----------
+
+    def _segment_path(self, first_seq):
+        """Each log segment is named after the first sequence number it may contain."""
+        return os.path.join(self.folder, f"wal-{first_seq:012d}.log")
+
+    def _segments(self):
+        """All log segments, oldest first."""
+        names = sorted(n for n in os.listdir(self.folder) if n.startswith("wal-"))
+        return [os.path.join(self.folder, n) for n in names]
+
+    def _recover(self):
+        """Load the latest snapshot, then replay every newer log record."""
+        snapshot_path = os.path.join(self.folder, "snapshot.json")
+        if os.path.exists(snapshot_path):
+            with open(snapshot_path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+            self.seq = data["seq"]
+            self.balances = data["balances"]
+
+        for path in self._segments():
+            with open(path, "rb") as file:
+                data = file.read()
+            good = 0  # Bytes of complete, valid records
+            for line in data.splitlines(keepends=True):
+                record = self._parse(line)
+                if record is None:
+                    break
+                good += len(line)
+                seq, op, account, amount = record
+                if seq <= self.seq:
+                    continue  # Already part of the snapshot
+                self._apply(op, account, amount)
+                self.seq = seq
+            if good < len(data):
+                # Torn write from a crash: cut it off so new records start on a
+                # clean line, and trust nothing after it
+                with open(path, "r+b") as file:
+                    file.truncate(good)
+                break
+
+        self.locks = {account: threading.Lock() for account in self.balances}
+
+    @staticmethod
+    def _checksum(body):
+        return f"{zlib.crc32(body.encode('utf-8')):08x}"
+
+    def _parse(self, line):
+        """Return (seq, op, account, amount) for a complete, valid log line, else None."""
+        if not line.endswith(b"\n"):
+            return None
+        try:
+            parts = line.decode("utf-8").split()
+            if len(parts) != 5 or parts[4] != self._checksum(" ".join(parts[:4])):
+                return None
+            return int(parts[0]), parts[1], parts[2], int(parts[3])
+        except ValueError:  # Also covers bad UTF-8
+            return None
+
+    def _apply(self, op, account, amount):
+        """Apply one record to the in-memory balances."""
+        if op == "O":
+            self.balances.setdefault(account, 0)
+        elif op == "D":
+            self.balances[account] += amount
+        elif op == "W":
+            self.balances[account] -= amount
+
+    def _record(self, op, account, amount):
+        """
+        Append a record to the log and apply it to the balances.
+        Both happen under the log lock, so a snapshot always sees a state
+        that matches the log exactly.
+        """
+        with self.log_lock:
+            self.seq += 1
+            body = f"{self.seq} {op} {account} {amount}"
+            self.log.write(f"{body} {self._checksum(body)}\n")
+            self._apply(op, account, amount)
+            self.unsynced += 1
+            if self.unsynced >= self.sync_every:
+                self._sync()
+            self.since_snapshot += 1
+            snapshot_due = self.since_snapshot >= self.snapshot_every
+
+        if snapshot_due:
+            self.snapshot()
+
+    def _sync(self):
+        """Flush the log and force it to disk (call with log_lock held)."""
+        self.log.flush()
+        os.fsync(self.log.fileno())
+        self.unsynced = 0
+
+    def snapshot(self):
+        """
+        Write all balances to snapshot.json and delete the log segments it covers.
+        Only the quick copy of the balances blocks other threads.
+        """
+        if not self.snapshot_lock.acquire(blocking=False):
+            return  # Another thread is already taking a snapshot
+        try:
+            with self.log_lock:
+                # Start a new log segment and copy the state it starts from
+                self._sync()
+                self.log.close()
+                self.log = open(self._segment_path(self.seq + 1), "a", encoding="utf-8")
+                seq, balances = self.seq, dict(self.balances)
+                self.since_snapshot = 0
+
+            snapshot_path = os.path.join(self.folder, "snapshot.json")
+            temp_path = snapshot_path + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump({"seq": seq, "balances": balances}, file)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, snapshot_path)
+
+            # Older segments are fully covered by the snapshot now
+            current = self._segment_path(seq + 1)
+            for path in self._segments():
+                if path < current:
+                    os.remove(path)
+        finally:
+            self.snapshot_lock.release()
+
+    def close(self):
+        """Force the remaining log records to disk and close the log."""
+        with self.log_lock:
+            self._sync()
+            self.log.close()
+
+    # ---------- accounts ----------
+
+    def _lock_for(self, account):
+        lock = self.locks.get(account)
+        if lock is None:
+            raise KeyError(f"no such account: {account}")
+        return lock
+
+    def open_account(self, account):
+        """Create an account with a zero balance (does nothing if it exists)."""
+        if not account or any(ch.isspace() for ch in account):
+            raise ValueError("account names must be non-empty and contain no spaces")
+        with self.accounts_lock:
+            if account in self.locks:
+                return
+            self._record("O", account, 0)
+            self.locks[account] = threading.Lock()
+
+    def balance(self, account):
+        """Return the balance of an account in cents."""
+        with self._lock_for(account):
+            return self.balances[account]
+
+    def deposit(self, account, cents):
+        """Add money to an account and return the new balance in cents."""
+        if cents <= 0:
+            raise ValueError("amount must be positive")
+        with self._lock_for(account):
+            self._record("D", account, cents)
+            return self.balances[account]
+
+    def withdraw(self, account, cents):
+        """Take money from an account and return the new balance in cents."""
+        if cents <= 0:
+            raise ValueError("amount must be positive")
+        with self._lock_for(account):
+            if cents > self.balances[account]:
+                raise InsufficientFundsError("insufficient funds")
+            self._record("W", account, cents)
+            return self.balances[account]
+
+
+def to_cents(text):
+    """Parse a dollar amount like '12.5' into integer cents."""
+    try:
+        value = Decimal(text.strip())
+        if not value.is_finite():
+            raise ValueError(f"invalid amount: {text!r}")
+        return int((value * 100).quantize(Decimal("1"), rounding=ROUND_HALF_UP))
+    except InvalidOperation:
+        raise ValueError(f"invalid amount: {text!r}")
+
+
+def format_cents(cents):
+    """Format integer cents as dollars, e.g. 1234 -> '12.34'."""
+    return f"{cents // 100}.{cents % 100:02d}"
+
+
+def benchmark(threads=16, accounts=2000, operations=20000):
+    """Measure sustained transactions per second with many threads on one ledger."""
+    with tempfile.TemporaryDirectory() as folder:
+        ledger = Ledger(folder, snapshot_every=50000)
+        names = [f"acct{i}" for i in range(accounts)]
+        for name in names:
+            ledger.open_account(name)
+            ledger.deposit(name, 10000)
+
+        def worker(seed):
+            rng = random.Random(seed)
+            for _ in range(operations):
+                name = rng.choice(names)
+                try:
+                    if rng.random() < 0.5:
+                        ledger.deposit(name, rng.randint(1, 5000))
+                    else:
+                        ledger.withdraw(name, rng.randint(1, 5000))
+                except InsufficientFundsError:
+                    pass
+
+        pool = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+        start = time.perf_counter()
+        for thread in pool:
+            thread.start()
+        for thread in pool:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        ledger.close()
+
+        total = threads * operations
+        print(f"🏦 {threads} threads, {accounts} accounts: {total} transactions in "
+              f"{elapsed:.2f}s ({total / elapsed:,.0f} tx/s)")
+
+        # Reopening must reproduce exactly the same balances
+        start = time.perf_counter()
+        reopened = Ledger(folder)
+        assert reopened.balances == ledger.balances
+        reopened.close()
+        print(f"♻️ Recovery from snapshot + log took {time.perf_counter() - start:.3f}s")
 
-# Display a welcome message
-print("🌟 Welcome to the Python Mini Banking System!")
-print("💳 Manage your account with deposit, withdraw, and balance check.\n")
 
 # Function to display the main menu
 def show_menu():
@@ -17,46 +289,62 @@ def show_menu():
     print("3️⃣  Check Balance")
     print("4️⃣  Exit")
 
-# Main loop to handle user actions
-while True:
-    show_menu()
-    choice = input("👉 Enter your choice (1-4): ")
 
-    # Option 1: Deposit money
-    if choice == '1':
-        try:
-            amount = float(input("💰 Enter amount to deposit: $"))
-            if amount <= 0:
-                print("⚠️ Please enter a positive amount.")
-            else:
-                balance += amount
-                print(f"✅ Successfully deposited ${amount:.2f}. New balance: ${balance:.2f}")
-        except ValueError:
-            print("❌ Invalid input! Please enter a valid number.")
-
-    # Option 2: Withdraw money
-    elif choice == '2':
-        try:
-            amount = float(input("💸 Enter amount to withdraw: $"))
-            if amount <= 0:
-                print("⚠️ Please enter a positive amount.")
-            elif amount > balance:
-                print("❌ Insufficient funds! Your current balance is ${:.2f}".format(balance))
-            else:
-                balance -= amount
-                print(f"✅ Successfully withdrew ${amount:.2f}. New balance: ${balance:.2f}")
-        except ValueError:
-            print("❌ Invalid input! Please enter a valid number.")
-
-    # Option 3: Check balance
-    elif choice == '3':
-        print(f"💼 Your current balance is: ${balance:.2f}")
-
-    # Option 4: Exit
-    elif choice == '4':
-        print("👋 Thank you for using the Mini Banking System. Goodbye!")
-        break
-
-    # Invalid choice
+def main():
+    # Display a welcome message
+    print("🌟 Welcome to the Python Mini Banking System!")
+    print("💳 Manage your account with deposit, withdraw, and balance check.\n")
+
+    ledger = Ledger()
+    account = input("👤 Enter your account name: ").strip() or "default"
+    try:
+        ledger.open_account(account)
+    except ValueError as e:
+        print(f"❌ {e}")
+        ledger.close()
+        return
+
+    # Main loop to handle user actions
+    while True:
+        show_menu()
+        choice = input("👉 Enter your choice (1-4): ")
+
+        # Option 1: Deposit money
+        if choice == '1':
+            try:
+                balance = ledger.deposit(account, to_cents(input("💰 Enter amount to deposit: $")))
+                print(f"✅ Deposit successful. New balance: ${format_cents(balance)}")
+            except ValueError:
+                print("⚠️ Please enter a valid positive amount.")
+
+        # Option 2: Withdraw money
+        elif choice == '2':
+            try:
+                balance = ledger.withdraw(account, to_cents(input("💸 Enter amount to withdraw: $")))
+                print(f"✅ Withdrawal successful. New balance: ${format_cents(balance)}")
+            except InsufficientFundsError:
+                print(f"❌ Insufficient funds! Your current balance is "
+                      f"${format_cents(ledger.balance(account))}")
+            except ValueError:
+                print("⚠️ Please enter a valid positive amount.")
+
+        # Option 3: Check balance
+        elif choice == '3':
+            print(f"💼 Your current balance is: ${format_cents(ledger.balance(account))}")
+
+        # Option 4: Exit
+        elif choice == '4':
+            ledger.close()
+            print("👋 Thank you for using the Mini Banking System. Goodbye!")
+            break
+
+        # Invalid choice
+        else:
+            print("❌ Invalid option! Please choose between 1 and 4.")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "bench":
+        benchmark()
     else:
-        print("❌ Invalid option! Please choose between 1 and 4.")
+        main()
@@ -2,9 +2,19 @@
 # 😄 Emoji Translator in Python
 # -----------------------------------------------
 
-# Display a welcome message
-print("🌟 Welcome to the Emoji Translator!")
-print("📝 Type a sentence and see it come alive with emojis!\n")
+# Words and multi-word phrases are matched in a single pass over the text with
+# an Aho-Corasick automaton, so thousands of dictionary entries cost no more
+# than a handful. Spaces, punctuation and letter case of the input are kept.
+
+# Usage:
+#   python Day-20.py                                   -> translate a sentence you type
+#   python Day-20.py chat.txt out.txt                  -> translate a whole file line by line
+#   python Day-20.py chat.txt out.txt --dict my.json   -> use a custom {"phrase": "emoji"} file
+
+import argparse
+import json
+import time
+from collections import deque
 
 # Dictionary of words and their emoji translations
 emoji_dict = {
@@ -23,33 +33,173 @@ emoji_dict = {
     "laugh": "😂",
     "hello": "👋",
     "bye": "👋",
+    "ice cream": "🍦",
+    "thumbs up": "👍",
+    "good night": "🌙",
 }
 
-# Ask the user to enter a message
-user_input = input("🔹 Enter a sentence: ")
 
-# Split the sentence into words
-words = user_input.lower().split()
+def load_dictionary(filename):
+    """Load a {"word or phrase": "emoji"} dictionary from a JSON file."""
+    with open(filename, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+class EmojiTranslator:
+    """
+    Replaces whole words and phrases from a dictionary with emojis.
+
+    The dictionary is compiled once into an Aho-Corasick automaton: a trie of all
+    phrases whose "failure" links are folded into a full transition table, so the
+    text is scanned with exactly one dictionary lookup per character.
+    """
+
+    def __init__(self, dictionary):
+        # transitions[state] maps a character to the next state
+        self.transitions = [{}]
+        # outputs[state] lists (length, emoji) of every phrase ending in that state
+        self.outputs = [[]]
+
+        for phrase, emoji in dictionary.items():
+            phrase = phrase.strip().lower()
+            if phrase:
+                self._add_phrase(phrase, emoji)
+        self._build_links()
+
+    def _add_phrase(self, phrase, emoji):
+        """Insert one phrase into the trie."""
+        state = 0
+        for ch in phrase:
+            next_state = self.transitions[state].get(ch)
+            if next_state is None:
+                next_state = len(self.transitions)
+                self.transitions[state][ch] = next_state
+                self.transitions.append({})
+                self.outputs.append([])
+            state = next_state
+        self.outputs[state] = [(len(phrase), emoji)]
+
+    def _build_links(self):
+        """
+        Compute failure links breadth-first and fold them into the transition table.
+        Transitions that lead back to a child of the root are left out and looked up
+        in the root at scan time, which keeps the table small.
+        """
+        transitions = self.transitions
+        root = transitions[0]
+        failure = [0] * len(transitions)
+        queue = deque(root.values())
+
+        while queue:
+            state = queue.popleft()
+            for ch, target in list(transitions[state].items()):
+                queue.append(target)
+                # Where to continue if the text stops matching after 'ch'
+                fallback = failure[state]
+                failure[target] = (transitions[fallback].get(ch) or root.get(ch, 0)) if state else 0
+                self.outputs[target] = self.outputs[target] + self.outputs[failure[target]]
+            # Inherit every transition of the failure state that this state lacks
+            if failure[state]:
+                for ch, target in transitions[failure[state]].items():
+                    transitions[state].setdefault(ch, target)
+
+    def translate(self, text):
+        """Translate one string, keeping everything that is not a dictionary phrase."""
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # A few characters lowercase to more than one character - map them one by one
+            lowered = "".join(ch.lower() if len(ch.lower()) == 1 else ch for ch in text)
+
+        transitions = self.transitions
+        outputs = self.outputs
+        from_root = transitions[0].get
+        size = len(text)
+        matches = []
+        state = 0
+
+        for end, ch in enumerate(lowered, 1):
+            if state:
+                state = transitions[state].get(ch) or from_root(ch, 0)
+            else:
+                state = from_root(ch, 0)
+            if outputs[state]:
+                for length, emoji in outputs[state]:
+                    start = end - length
+                    # Only whole words count: "love" must not match inside "lovely"
+                    if (start == 0 or not text[start - 1].isalnum()) and \
+                            (end == size or not text[end].isalnum()):
+                        matches.append((start, -end, emoji))
+
+        if not matches:
+            return text
+
+        # Pick the leftmost, longest matches that do not overlap
+        pieces = []
+        position = 0
+        for start, negative_end, emoji in sorted(matches):
+            if start >= position:
+                pieces.append(text[position:start])
+                pieces.append(emoji)
+                position = -negative_end
+        pieces.append(text[position:])
+        return "".join(pieces)
+
+    def translate_file(self, input_path, output_path):
+        """Translate a text file line by line, so files of any size can be processed."""
+        translate = self.translate
+        lines = 0
+        with open(input_path, "r", encoding="utf-8") as source, \
+                open(output_path, "w", encoding="utf-8") as target:
+            for line in source:
+                target.write(translate(line))
+                lines += 1
+        return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Translate text into emojis.")
+    parser.add_argument("input", nargs="?", help="text file to translate")
+    parser.add_argument("output", nargs="?", help="where to write the translated file")
+    parser.add_argument("--dict", help="JSON file with extra {phrase: emoji} entries")
+    args = parser.parse_args()
+
+    dictionary = dict(emoji_dict)
+    if args.dict:
+        dictionary.update(load_dictionary(args.dict))
+    translator = EmojiTranslator(dictionary)
+
+    # Streaming file mode
+    if args.input and args.output:
+        start = time.perf_counter()
+        lines = translator.translate_file(args.input, args.output)
+        elapsed = time.perf_counter() - start
+        print(f"✅ Translated {lines} lines into {args.output} in {elapsed:.2f}s")
+        return
+
+    # Display a welcome message
+    print("🌟 Welcome to the Emoji Translator!")
+    print("📝 Type a sentence and see it come alive with emojis!\n")
+
+    # Ask the user to enter a message
+    user_input = input("🔹 Enter a sentence: ")
+
+    # Replace each word or phrase with an emoji if available
+    emoji_sentence = translator.translate(user_input)
 
-# Replace each word with an emoji if available
-translated = []
-for word in words:
-    # Get emoji if the word is in the dictionary, else keep the original word
-    translated.append(emoji_dict.get(word, word))
+    # Display the translated message
+    print("\n🧠 Translated Sentence with Emojis:")
+    print(emoji_sentence)
 
-# Join the translated list into a sentence
-emoji_sentence = " ".join(translated)
+    # Friendly closing
+    print("\n✅ Try again with different words to see more emojis! 🎉")
 
-# Display the translated message
-print("\n🧠 Translated Sentence with Emojis:")
-print(emoji_sentence)
 
-# Friendly closing
-print("\n✅ Try again with different words to see more emojis! 🎉")
+if __name__ == "__main__":
+    main()
 
 # End of the Emoji Translator
 # Thank you for using the Emoji Translator! 😊
 
 # How to Work this code
-# Input:- I love pizza and my dog is cool
-# Output:- i ❤️ 🍕 and my 🐶 is 😎
+# Input:- I love pizza and ice cream, my dog is cool!
+# Output:- I ❤️ 🍕 and 🍦, my 🐶 is 😎!
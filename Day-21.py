@@ -2,8 +2,22 @@
 # 😄 Contact Book Program using OOP and File Saving
 # -----------------------------------------------
 
+# Contacts are stored in a SQLite database:
+# - an FTS5 full-text index makes name and email searches fast,
+# - an index on the phone digits answers phone-number prefix searches,
+# - changes are written incrementally and committed in batches,
+# - nothing is loaded at startup; Contact objects are only created for the
+#   rows being viewed or returned by a search.
+# An existing contacts.txt (JSON) file is imported automatically on first run.
+
 import os  # For checking if file exists
-import json  # For saving/loading data in JSON format
+import json  # For importing the old JSON contacts file
+import re  # For extracting the digits of a phone number
+import sqlite3  # For the contact database
+import sys  # For the "bench" command-line option
+import tempfile  # For the benchmark database
+import time  # For timing the benchmark
+import tracemalloc  # For measuring memory in the benchmark
 
 # -----------------------------------------------
 # 📦 Contact Class - Represents a single contact
@@ -12,6 +26,9 @@ import json  # For saving/loading data in JSON format
 class Contact:
     """Defines a contact with name, phone, and email."""
 
+    # No per-instance __dict__: each contact only stores these three references
+    __slots__ = ('name', 'phone', 'email')
+
     def __init__(self, name, phone, email):
         # Initialize contact attributes
         self.name = name
@@ -31,50 +48,142 @@ class Contact:
 # 📚 ContactBook Class - Handles all operations
 # -----------------------------------------------
 
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS contacts (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    phone TEXT NOT NULL,
+    email TEXT NOT NULL,
+    phone_digits TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_contacts_phone_digits ON contacts(phone_digits);
+CREATE INDEX IF NOT EXISTS idx_contacts_name ON contacts(name COLLATE NOCASE);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS contacts_fts USING fts5(
+    name, email, content='contacts', content_rowid='id'
+);
+
+-- Keep the full-text index in step with the contacts table
+CREATE TRIGGER IF NOT EXISTS contacts_ai AFTER INSERT ON contacts BEGIN
+    INSERT INTO contacts_fts(rowid, name, email) VALUES (new.id, new.name, new.email);
+END;
+CREATE TRIGGER IF NOT EXISTS contacts_ad AFTER DELETE ON contacts BEGIN
+    INSERT INTO contacts_fts(contacts_fts, rowid, name, email)
+    VALUES ('delete', old.id, old.name, old.email);
+END;
+
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+
+def phone_digits(phone):
+    """Keep only the digits of a phone number, e.g. '+1 (555) 010' -> '1555010'."""
+    return re.sub(r"\D", "", phone)
+
+
 class ContactBook:
-    """Manages a list of Contact objects and handles file operations."""
+    """Manages contacts stored in a SQLite database with search indexes."""
 
-    def __init__(self, filename="contacts.txt"):
-        self.filename = filename  # File to save/load contacts
-        self.contacts = []  # Store list of contacts
-        self.load_contacts()  # Load existing contacts from file
+    def __init__(self, filename="contacts.txt", db_path="contacts.db", batch_size=500):
+        self.filename = filename  # Old JSON file, imported once
+        self.db_path = db_path  # SQLite database file
+        self.batch_size = batch_size  # Commit after this many changes
+        self.pending = 0  # Changes not committed yet
+        self.conn = sqlite3.connect(db_path)
+        self.conn.executescript(SCHEMA)
+        self.load_contacts()  # Import the JSON file on first run
 
     def load_contacts(self):
-        # Load contacts from file if it exists
-        if os.path.exists(self.filename):
-            try:
-                with open(self.filename, "r") as file:
-                    data = json.load(file)
-                    # Convert each dictionary to Contact object
-                    self.contacts = [Contact(**contact) for contact in data]
-            except Exception as e:
-                print(f"⚠️ Error loading contacts: {e}")
+        # Import contacts from the old JSON file the first time the database is used
+        imported = self.conn.execute("SELECT value FROM meta WHERE key = 'json_imported'").fetchone()
+        if imported or not os.path.exists(self.filename):
+            return
+        try:
+            with open(self.filename, "r") as file:
+                data = json.load(file)
+            self.add_contacts((c['name'], c['phone'], c['email']) for c in data)
+            self.conn.execute("INSERT INTO meta VALUES ('json_imported', ?)", (self.filename,))
+            self.save_contacts()
+            print(f"📥 Imported {len(data)} contacts from {self.filename}.")
+        except Exception as e:
+            print(f"⚠️ Error loading contacts: {e}")
 
     def save_contacts(self):
-        # Save all contacts to file in JSON format
+        # Commit any pending changes to the database
         try:
-            with open(self.filename, "w") as file:
-                json.dump([c.to_dict() for c in self.contacts], file, indent=4)
+            self.conn.commit()
+            self.pending = 0
         except Exception as e:
             print(f"⚠️ Error saving contacts: {e}")
 
+    def _changed(self, count=1):
+        # Commit in batches instead of after every single change
+        self.pending += count
+        if self.pending >= self.batch_size:
+            self.save_contacts()
+
+    def add_contacts(self, contacts):
+        # Insert many (name, phone, email) tuples in one statement
+        rows = [(name, phone, email, phone_digits(phone)) for name, phone, email in contacts]
+        self.conn.executemany(
+            "INSERT INTO contacts (name, phone, email, phone_digits) VALUES (?, ?, ?, ?)", rows)
+        self._changed(len(rows))
+
     def add_contact(self, name, phone, email):
-        # Add a new contact to the list
-        self.contacts.append(Contact(name, phone, email))
+        # Add a new contact to the database
+        self.add_contacts([(name, phone, email)])
         print("✅ Contact added successfully!")
 
+    def count_contacts(self):
+        # Number of saved contacts
+        return self.conn.execute("SELECT COUNT(*) FROM contacts").fetchone()[0]
+
+    def iter_contacts(self):
+        # Yield contacts one at a time straight from the database cursor
+        for row in self.conn.execute("SELECT name, phone, email FROM contacts ORDER BY id"):
+            yield Contact(*row)
+
     def view_contacts(self):
         # Display all saved contacts
-        if not self.contacts:
+        count = 0
+        for count, contact in enumerate(self.iter_contacts(), 1):
+            if count == 1:
+                print("\n📒 All Contacts:")
+            print(f"\nContact {count}:\n{contact}")
+        if count == 0:
             print("📭 No contacts found.")
-        else:
-            print("\n📒 All Contacts:")
-            for idx, contact in enumerate(self.contacts, 1):
-                print(f"\nContact {idx}:\n{contact}")
+
+    def find_contacts(self, keyword, limit=50):
+        # Return contacts whose name/email words start with the keyword,
+        # or whose phone number starts with the keyword's digits
+        keyword = keyword.strip()
+        found = {}
+
+        digits = phone_digits(keyword)
+        if digits and re.fullmatch(r"[\d\s()+.-]+", keyword):
+            rows = self.conn.execute(
+                "SELECT id, name, phone, email FROM contacts "
+                "WHERE phone_digits >= ? AND phone_digits < ? LIMIT ?",
+                (digits, digits + ":", limit))  # ':' sorts right after '9'
+            for row in rows:
+                found[row[0]] = Contact(*row[1:])
+
+        words = re.findall(r"\w+", keyword)
+        if words and len(found) < limit:
+            # Every word must match the start of a word in the name or email
+            query = " ".join('"' + w.replace('"', '""') + '"*' for w in words)
+            rows = self.conn.execute(
+                "SELECT c.id, c.name, c.phone, c.email FROM contacts_fts "
+                "JOIN contacts c ON c.id = contacts_fts.rowid "
+                "WHERE contacts_fts MATCH ? LIMIT ?", (query, limit))
+            for row in rows:
+                found.setdefault(row[0], Contact(*row[1:]))
+
+        return list(found.values())[:limit]
 
     def search_contact(self, keyword):
-        # Search contacts by name or phone
-        found = [c for c in self.contacts if keyword.lower() in c.name.lower() or keyword in c.phone]
+        # Search contacts by name, email or phone
+        found = self.find_contacts(keyword)
         if found:
             print(f"\n🔍 Found {len(found)} contact(s):")
             for contact in found:
@@ -84,13 +193,18 @@ class ContactBook:
 
     def delete_contact(self, name):
         # Delete a contact by name (case-insensitive)
-        original_count = len(self.contacts)
-        self.contacts = [c for c in self.contacts if c.name.lower() != name.lower()]
-        if len(self.contacts) < original_count:
+        cursor = self.conn.execute("DELETE FROM contacts WHERE name = ? COLLATE NOCASE", (name,))
+        if cursor.rowcount > 0:
+            self._changed(cursor.rowcount)
             print("🗑️ Contact deleted successfully.")
         else:
             print("❌ Contact not found.")
 
+    def close(self):
+        # Commit pending changes and close the database
+        self.save_contacts()
+        self.conn.close()
+
     def menu(self):
         # -----------------------------------------------
         # 🧭 Menu Method - User interaction loop
@@ -115,7 +229,7 @@ class ContactBook:
                 self.view_contacts()
 
             elif choice == '3':
-                keyword = input("Enter name or phone to search: ")
+                keyword = input("Enter name, email or phone to search: ")
                 self.search_contact(keyword)
 
             elif choice == '4':
@@ -123,7 +237,7 @@ class ContactBook:
                 self.delete_contact(name)
 
             elif choice == '5':
-                self.save_contacts()  # Save contacts before exiting
+                self.close()  # Save contacts before exiting
                 print("💾 Contacts saved. Goodbye!")
                 break
 
@@ -131,12 +245,72 @@ class ContactBook:
                 print("⚠️ Invalid choice. Please enter a number between 1 and 5.")
 
 
+# -----------------------------------------------
+# ⏱️ Benchmark - startup time and memory per contact
+# -----------------------------------------------
+
+class DictContact:
+    """The old Contact layout (with a per-instance __dict__), kept for comparison."""
+
+    def __init__(self, name, phone, email):
+        self.name = name
+        self.phone = phone
+        self.email = email
+
+
+def _memory_of(build):
+    # Memory (bytes) still held by whatever build() returns
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def benchmark(count=2000000, sample=200000):
+    with tempfile.TemporaryDirectory() as folder:
+        json_path = os.path.join(folder, "none.txt")
+        db_path = os.path.join(folder, "bench.db")
+        book = ContactBook(filename=json_path, db_path=db_path)
+        print(f"⚙️ Creating a book with {count} contacts...")
+        book.add_contacts((f"Person {i}", f"555{i:07d}", f"person{i}@example.com")
+                          for i in range(count))
+        book.close()
+
+        # Startup: the book opens the database but builds no Contact objects
+        start = time.perf_counter()
+        book = ContactBook(filename=json_path, db_path=db_path)
+        startup = time.perf_counter() - start
+        print(f"🚀 Startup with {book.count_contacts()} contacts: {startup * 1000:.1f} ms")
+
+        # Memory: the old eager load kept every contact as a __dict__ object
+        sample = min(sample, count)
+        query = "SELECT name, phone, email FROM contacts LIMIT ?"
+        eager = _memory_of(lambda: [DictContact(*row) for row in book.conn.execute(query, (sample,))])
+        slotted = _memory_of(lambda: [Contact(*row) for row in book.conn.execute(query, (sample,))])
+        lazy = _memory_of(lambda: ContactBook(filename=json_path, db_path=db_path))
+        print(f"🧠 Holding {sample} contacts eagerly: __dict__ objects {eager / 2**20:.1f} MB, "
+              f"__slots__ objects {slotted / 2**20:.1f} MB ({eager / slotted:.1f}x less)")
+        print(f"🧠 Lazy book at startup: {lazy / 2**10:.1f} KB for all {count} contacts")
+
+        start = time.perf_counter()
+        found = book.find_contacts(f"person{count // 2}")
+        print(f"🔍 Search returned {len(found)} contact(s) in "
+              f"{(time.perf_counter() - start) * 1000:.2f} ms")
+        book.close()
+
+
 # -----------------------------------------------
 # 🚀 Program Entry Point
 # -----------------------------------------------
 if __name__ == "__main__":
-    # Create an instance of ContactBook and start the menu
-    book = ContactBook()
-    book.menu()
+    if len(sys.argv) > 1 and sys.argv[1] == "bench":
+        # Optional contact count, e.g. "python Day-21.py bench 100000"
+        benchmark(int(sys.argv[2]) if len(sys.argv) > 2 else 2000000)
+    else:
+        # Create an instance of ContactBook and start the menu
+        book = ContactBook()
+        book.menu()
 # End of the Contact Book Program
 # Thank you for using the Contact Book! 📖
\ No newline at end of file
@@ -2,9 +2,28 @@
 # 🧑‍🎓 Student Grading System using OOP & File Handling
 # -----------------------------------------------
 
+# Marks are held column-wise in a Gradebook: one NumPy array with a row per
+# student and a column per subject. Totals, percentages and grades for the
+# whole class are computed in one vectorised pass, and a roll-number index
+# finds any student's row in O(1).
+
 import os  # For file operations
+import sys  # For the "ingest" command-line option
+import glob  # For finding the stored mark files
 import json  # For saving/loading structured data
 
+import numpy as np  # For the columnar marks table
+import pandas as pd  # For Parquet import/export
+
+# Grade boundaries: a percentage of at least the bound earns the grade
+GRADE_BANDS = [(90, 'A+'), (80, 'A'), (70, 'B'), (60, 'C'), (50, 'D'), (0, 'F')]
+GRADE_EDGES = np.array([bound for bound, _ in reversed(GRADE_BANDS[:-1])])  # 50 ... 90
+GRADE_LABELS = np.array([grade for _, grade in reversed(GRADE_BANDS)])  # F ... A+
+
+# Rows read from a marks CSV at a time during bulk ingestion
+INGEST_CHUNK_ROWS = 1000000
+STORE_FOLDER = "grades_store"  # Where MarkStore keeps bulk-ingested marks
+
 
 # -----------------------------------------------
 # 📘 Student Class - Represents an individual student
@@ -23,18 +42,10 @@ class Student:
 
     def calculate_grade(self):
         """Determine grade based on percentage."""
-        if self.percentage >= 90:
-            return 'A+'
-        elif self.percentage >= 80:
-            return 'A'
-        elif self.percentage >= 70:
-            return 'B'
-        elif self.percentage >= 60:
-            return 'C'
-        elif self.percentage >= 50:
-            return 'D'
-        else:
-            return 'F'
+        for bound, grade in GRADE_BANDS:
+            if self.percentage >= bound:
+                return grade
+        return GRADE_BANDS[-1][1]
 
     def to_dict(self):
         """Convert student data to dictionary format for saving."""
@@ -60,6 +71,379 @@ class Student:
         )
 
 
+# -----------------------------------------------
+# 📊 Gradebook Class - Columnar marks for a whole cohort
+# -----------------------------------------------
+
+class Gradebook:
+    """Stores every student's marks in one (students x subjects) NumPy array."""
+
+    def __init__(self, subjects=()):
+        self.subjects = []  # Column order of the marks array
+        self.subject_index = {}  # Subject name -> column
+        self.names = []
+        self.roll_numbers = []
+        self.row_of = {}  # Roll number -> row, for O(1) lookups
+        self.size = 0
+        self._data = np.empty((16, 0))  # Grows by doubling; rows past self.size are unused
+        self.add_subjects(subjects)
+
+    @property
+    def marks(self):
+        """The (students x subjects) marks array; NaN where a subject was not taken."""
+        return self._data[:self.size, :len(self.subjects)]
+
+    def add_subjects(self, subjects):
+        """Add columns for any subjects not seen before."""
+        new = [s for s in dict.fromkeys(subjects) if s not in self.subject_index]
+        if not new:
+            return
+        for subject in new:
+            self.subject_index[subject] = len(self.subjects)
+            self.subjects.append(subject)
+        extra = np.full((self._data.shape[0], len(new)), np.nan)
+        self._data = np.hstack([self._data[:, :len(self.subjects) - len(new)], extra])
+
+    def _reserve(self, rows):
+        """Make room for 'rows' more students."""
+        needed = self.size + rows
+        if needed > self._data.shape[0]:
+            capacity = max(needed, 2 * self._data.shape[0])
+            grown = np.full((capacity, self._data.shape[1]), np.nan)
+            grown[:self.size] = self._data[:self.size]
+            self._data = grown
+
+    def add_students(self, names, roll_numbers, marks, subjects):
+        """
+        Add (or replace) many students at once.
+        'marks' is a 2-D array with one row per student and one column per entry of 'subjects'.
+        """
+        names, roll_numbers = list(names), list(roll_numbers)
+        marks = np.asarray(marks, dtype=np.float64).reshape(len(names), len(subjects))
+
+        # A roll number repeated within the batch keeps its last entry
+        last = {roll_no: i for i, roll_no in enumerate(roll_numbers)}
+        if len(last) < len(roll_numbers):
+            keep = sorted(last.values())
+            names = [names[i] for i in keep]
+            roll_numbers = [roll_numbers[i] for i in keep]
+            marks = marks[keep]
+
+        self.add_subjects(subjects)
+        columns = [self.subject_index[s] for s in subjects]
+
+        rows = []
+        new_names, new_rolls = [], []
+        next_row = self.size
+        for name, roll_no in zip(names, roll_numbers):
+            row = self.row_of.get(roll_no)
+            if row is None:
+                row = next_row
+                next_row += 1
+                self.row_of[roll_no] = row
+                new_names.append(name)
+                new_rolls.append(roll_no)
+            else:
+                self.names[row] = name
+            rows.append(row)
+
+        self._reserve(next_row - self.size)
+        self._data[np.ix_(rows, range(len(self.subjects)))] = np.nan  # Clear replaced rows
+        self._data[np.ix_(rows, columns)] = marks
+        self.names.extend(new_names)
+        self.roll_numbers.extend(new_rolls)
+        self.size = next_row
+
+    def add_student(self, name, roll_no, marks):
+        """Add or replace one student, given a {subject: score} dictionary."""
+        subjects = list(marks)
+        self.add_students([name], [roll_no], [[marks[s] for s in subjects]], subjects)
+
+    def student(self, roll_no):
+        """Return a Student object for a roll number, or None (O(1) lookup)."""
+        row = self.row_of.get(roll_no)
+        if row is None:
+            return None
+        return self._student_at(row)
+
+    def _student_at(self, row):
+        values = self.marks[row]
+        marks = {s: float(values[i]) for i, s in enumerate(self.subjects) if not np.isnan(values[i])}
+        return Student(self.names[row], self.roll_numbers[row], marks)
+
+    def students(self):
+        """Yield every student as a Student object, in insertion order."""
+        for row in range(self.size):
+            yield self._student_at(row)
+
+    def results(self):
+        """
+        Totals, percentages and grades for every student in one vectorised pass.
+        Returns a dictionary of arrays aligned with the rows.
+        """
+        marks = self.marks
+        taken = (~np.isnan(marks)).sum(axis=1)
+        totals = np.nansum(marks, axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            percentages = np.where(taken > 0, totals / taken, 0.0)
+        grades = GRADE_LABELS[np.digitize(percentages, GRADE_EDGES)]
+        return {"total": totals, "percentage": percentages, "grade": grades}
+
+    def scores(self, subject):
+        """Scores of one subject (NaN for students who did not take it)."""
+        if subject is None:
+            return self.results()["percentage"]
+        if subject not in self.subject_index:
+            raise KeyError(f"unknown subject: {subject}")
+        return self.marks[:, self.subject_index[subject]]
+
+    def ranks(self, subject=None):
+        """
+        Rank of every student in a subject (or overall percentage when subject is None).
+        1 is the best; equal scores share a rank. NaN where the subject was not taken.
+        """
+        scores = self.scores(subject)
+        taken = ~np.isnan(scores)
+        ordered = np.sort(scores[taken])
+        ranks = np.full(len(scores), np.nan)
+        ranks[taken] = 1 + len(ordered) - np.searchsorted(ordered, scores[taken], side="right")
+        return ranks
+
+    def percentiles(self, subject=None):
+        """Percentage of students scoring at or below each student's score."""
+        scores = self.scores(subject)
+        taken = ~np.isnan(scores)
+        ordered = np.sort(scores[taken])
+        result = np.full(len(scores), np.nan)
+        if len(ordered):
+            result[taken] = 100 * np.searchsorted(ordered, scores[taken], side="right") / len(ordered)
+        return result
+
+    def histogram(self, subject=None, bins=10, score_range=(0, 100)):
+        """Return (counts, bin_edges) of the scores in a subject."""
+        scores = self.scores(subject)
+        return np.histogram(scores[~np.isnan(scores)], bins=bins, range=score_range)
+
+    def to_frame(self):
+        """The gradebook as a pandas DataFrame (one column per subject plus results)."""
+        df = pd.DataFrame(self.marks, columns=self.subjects)
+        df.insert(0, "roll_no", self.roll_numbers)
+        df.insert(0, "name", self.names)
+        for column, values in self.results().items():
+            df[column] = values
+        return df
+
+    def to_parquet(self, path):
+        """Save the gradebook to a Parquet file."""
+        self.to_frame().to_parquet(path, index=False)
+
+    def load_frame(self, df):
+        """Add every row of a DataFrame with name, roll_no and one column per subject."""
+        subjects = [c for c in df.columns if c not in ("name", "roll_no", "total", "percentage", "grade")]
+        self.add_students(df["name"].astype(str).tolist(), df["roll_no"].astype(str).tolist(),
+                          df[subjects].to_numpy(dtype=np.float64), subjects)
+
+    def read_parquet(self, path):
+        """Add every student from a Parquet file written by to_parquet."""
+        self.load_frame(pd.read_parquet(path))
+
+
+# -----------------------------------------------
+# 📥 MarkStore Class - Bulk ingestion of large mark files
+# -----------------------------------------------
+
+class MarkStore:
+    """
+    Append-only store for very large mark dumps.
+
+    A CSV with the columns roll_no, name, subject, score is read in chunks.
+    Each chunk is validated, appended to the store as its own Parquet file,
+    and folded into the latest mark per (roll number, subject). A later mark
+    for the same subject replaces the earlier one, so corrections and
+    re-imports never count twice. Only the students that appear in the
+    chunk are updated, so memory depends on the chunk size and the number
+    of student/subject pairs, never on the number of rows in the dump.
+    """
+
+    COLUMNS = ["roll_no", "name", "subject", "score"]
+
+    def __init__(self, folder=STORE_FOLDER):
+        self.folder = folder
+        self.marks_folder = os.path.join(folder, "marks")
+        self.aggregates_path = os.path.join(folder, "aggregates.parquet")
+        self.latest_path = os.path.join(folder, "latest.parquet")
+        os.makedirs(self.marks_folder, exist_ok=True)
+        self._reset()
+        if os.path.exists(self.aggregates_path) and not os.path.exists(self.latest_path):
+            self.rebuild_aggregates()  # Store written before latest marks were kept
+        elif os.path.exists(self.aggregates_path):
+            latest = pd.read_parquet(self.latest_path)
+            self.keys = pd.MultiIndex.from_arrays([latest["roll_no"], latest["subject"]],
+                                                  names=["roll_no", "subject"])
+            self.scores = latest["score"].to_numpy(dtype=np.float64)
+            df = pd.read_parquet(self.aggregates_path)
+            self.index = pd.Index(df.index.astype(str), name="roll_no")
+            self.names = df["name"].to_numpy(dtype=object)
+            self.totals = df["total"].to_numpy(dtype=np.float64)
+            self.counts = df["subjects"].to_numpy(dtype=np.int64)
+            self.percentages = df["percentage"].to_numpy(dtype=np.float64)
+            self.grades = df["grade"].to_numpy(dtype=object)
+
+    def _reset(self):
+        """Start with no students. Aggregates are kept as one array per column."""
+        self.index = pd.Index([], dtype=str, name="roll_no")  # Roll number -> position
+        self.names = np.empty(0, dtype=object)
+        self.totals = np.empty(0, dtype=np.float64)
+        self.counts = np.empty(0, dtype=np.int64)
+        self.percentages = np.empty(0, dtype=np.float64)
+        self.grades = np.empty(0, dtype=object)
+        # Latest score per (roll number, subject) pair
+        self.keys = pd.MultiIndex.from_arrays([[], []], names=["roll_no", "subject"])
+        self.scores = np.empty(0, dtype=np.float64)
+
+    @property
+    def aggregates(self):
+        """Per-student totals, subject counts, percentages and grades as a DataFrame."""
+        return pd.DataFrame({"name": self.names, "total": self.totals, "subjects": self.counts,
+                             "percentage": self.percentages, "grade": self.grades},
+                            index=self.index)
+
+    def _part_paths(self):
+        return sorted(glob.glob(os.path.join(self.marks_folder, "part-*.parquet")))
+
+    @staticmethod
+    def validate(chunk):
+        """Split a chunk into (valid rows, rejected rows)."""
+        score = pd.to_numeric(chunk["score"], errors="coerce")
+        valid = (score.between(0, 100)
+                 & chunk["roll_no"].notna() & (chunk["roll_no"].str.strip() != "")
+                 & chunk["subject"].notna() & (chunk["subject"].str.strip() != ""))
+        good = chunk[valid].assign(score=score[valid])
+        return good, chunk[~valid]
+
+    def _update_aggregates(self, marks):
+        """Fold a chunk of valid marks into the aggregates, touching only its students."""
+        latest = marks.drop_duplicates(["roll_no", "subject"], keep="last")
+        names = marks.groupby("roll_no", sort=False)["name"].last()
+
+        positions = self.index.get_indexer(names.index)
+        new = positions < 0
+        if new.any():
+            # Give students seen for the first time a fresh position at the end
+            start = len(self.index)
+            added = int(new.sum())
+            self.index = self.index.append(names.index[new])
+            self.names = np.concatenate([self.names, np.empty(added, dtype=object)])
+            self.totals = np.concatenate([self.totals, np.zeros(added)])
+            self.counts = np.concatenate([self.counts, np.zeros(added, dtype=np.int64)])
+            self.percentages = np.concatenate([self.percentages, np.zeros(added)])
+            self.grades = np.concatenate([self.grades, np.empty(added, dtype=object)])
+            positions[new] = np.arange(start, start + added)
+        self.names[positions] = names.to_numpy(dtype=object)
+
+        # Replace the score of known pairs and add the new ones. Each student's
+        # total moves by the difference, and only new pairs add to the count.
+        keys = pd.MultiIndex.from_arrays([latest["roll_no"], latest["subject"]],
+                                         names=["roll_no", "subject"])
+        scores = latest["score"].to_numpy(dtype=np.float64)
+        slots = self.keys.get_indexer(keys)
+        known = slots >= 0
+        change = scores.copy()
+        change[known] -= self.scores[slots[known]]
+        self.scores[slots[known]] = scores[known]
+        self.keys = self.keys.append(keys[~known])
+        self.scores = np.concatenate([self.scores, scores[~known]])
+
+        rows = self.index.get_indexer(latest["roll_no"])
+        np.add.at(self.totals, rows, change)
+        np.add.at(self.counts, rows[~known], 1)
+
+        # Recompute percentage and grade for the affected students only
+        percentages = self.totals[positions] / self.counts[positions]
+        self.percentages[positions] = percentages
+        self.grades[positions] = GRADE_LABELS[np.digitize(percentages, GRADE_EDGES)]
+
+    def ingest_csv(self, path, chunk_rows=INGEST_CHUNK_ROWS, rejects_path=None):
+        """
+        Stream a marks CSV into the store. Returns (accepted rows, rejected rows).
+        Rejected rows are written to 'rejects_path' (default: <store>/rejected.csv).
+        """
+        rejects_path = rejects_path or os.path.join(self.folder, "rejected.csv")
+        next_part = len(self._part_paths())
+        accepted = rejected = 0
+
+        reader = pd.read_csv(path, usecols=self.COLUMNS, dtype=str, chunksize=chunk_rows)
+        for chunk in reader:
+            good, bad = self.validate(chunk)
+            if len(bad):
+                bad.to_csv(rejects_path, mode="a", index=False,
+                           header=not os.path.exists(rejects_path))
+                rejected += len(bad)
+            if len(good):
+                part = os.path.join(self.marks_folder, f"part-{next_part:06d}.parquet")
+                good.to_parquet(part, index=False)
+                next_part += 1
+                self._update_aggregates(good)
+                accepted += len(good)
+
+        self.save()
+        return accepted, rejected
+
+    def rebuild_aggregates(self):
+        """Recompute the aggregates from every stored mark file, one file at a time."""
+        self._reset()
+        for part in self._part_paths():
+            self._update_aggregates(pd.read_parquet(part))
+        self.save()
+
+    def save(self):
+        """Write the latest marks and the aggregates atomically."""
+        latest = pd.DataFrame({"roll_no": self.keys.get_level_values("roll_no"),
+                               "subject": self.keys.get_level_values("subject"),
+                               "score": self.scores})
+        latest.to_parquet(self.latest_path + ".tmp", index=False)
+        self.aggregates.to_parquet(self.aggregates_path + ".tmp")
+        os.replace(self.latest_path + ".tmp", self.latest_path)
+        os.replace(self.aggregates_path + ".tmp", self.aggregates_path)
+
+    def student(self, roll_no):
+        """
+        One student's aggregates and marks as a formatted string, or None.
+        The marks are read from the part files, filtered by roll number.
+        """
+        position = self.index.get_indexer([roll_no])[0]
+        if position < 0:
+            return None
+        marks = {}
+        for part in self._part_paths():
+            rows = pd.read_parquet(part, columns=["subject", "score"], filters=[("roll_no", "==", roll_no)])
+            marks.update(zip(rows["subject"], rows["score"]))  # Latest mark per subject
+        marks_str = "\n".join(f"{subject}: {score:g}" for subject, score in marks.items())
+        return (
+            f"\nName: {self.names[position]}\n"
+            f"Roll No: {roll_no}\n"
+            f"{marks_str}\n"
+            f"Total: {self.totals[position]:g} over {self.counts[position]} marks\n"
+            f"Percentage: {self.percentages[position]:.2f}%\n"
+            f"Grade: {self.grades[position]}"
+        )
+
+    def subject_scores(self, subject):
+        """Latest score of every student in 'subject', indexed by roll number."""
+        frames = [pd.read_parquet(part, columns=["roll_no", "score"], filters=[("subject", "==", subject)])
+                  for part in self._part_paths()]
+        if not frames:
+            return pd.Series(dtype=np.float64)
+        scores = pd.concat(frames, ignore_index=True)
+        return scores.groupby("roll_no", sort=False)["score"].last()
+
+    def summary(self):
+        """Number of students and how many earned each grade."""
+        grades, counts = np.unique(self.grades.astype(str), return_counts=True)
+        counts = dict(zip(grades.tolist(), counts.tolist()))
+        return len(self.index), {grade: counts.get(grade, 0) for _, grade in GRADE_BANDS}
+
+
 # -----------------------------------------------
 # 🗃️ GradingSystem Class - Manages all students
 # -----------------------------------------------
@@ -69,7 +453,9 @@ class GradingSystem:
 
     def __init__(self, filename="grades.txt"):
         self.filename = filename
-        self.students = []  # List to store Student objects
+        self.book = Gradebook()  # Columnar store of all students
+        # Bulk-ingested marks, if any have been ingested
+        self.store = MarkStore() if os.path.isdir(STORE_FOLDER) else None
         self.load_data()
 
     def load_data(self):
@@ -78,7 +464,8 @@ class GradingSystem:
             try:
                 with open(self.filename, 'r') as file:
                     data = json.load(file)
-                    self.students = [Student(d['name'], d['roll_no'], d['marks']) for d in data]
+                    for d in data:
+                        self.book.add_student(d['name'], d['roll_no'], d['marks'])
             except Exception as e:
                 print(f"⚠️ Error loading data: {e}")
 
@@ -86,7 +473,7 @@ class GradingSystem:
         """Save student records to file."""
         try:
             with open(self.filename, 'w') as file:
-                json.dump([s.to_dict() for s in self.students], file, indent=4)
+                json.dump([s.to_dict() for s in self.book.students()], file, indent=4)
         except Exception as e:
             print(f"⚠️ Error saving data: {e}")
 
@@ -102,31 +489,96 @@ class GradingSystem:
                 score = float(input(f"Marks for {subject}: "))
                 marks[subject] = score
 
-            student = Student(name, roll_no, marks)
-            self.students.append(student)
+            Student(name, roll_no, marks)  # Validates the marks (e.g. at least one subject)
+            self.book.add_student(name, roll_no, marks)
             print("✅ Student record added successfully.")
         except Exception as e:
             print(f"❌ Error adding student: {e}")
 
     def view_all_students(self):
         """Display all student records."""
-        if not self.students:
+        stored = len(self.store.index) if self.store else 0
+        if not self.book.size and not stored:
             print("📭 No student records available.")
-        else:
+            return
+        if self.book.size:
             print("\n📄 Student Records:")
-            for idx, student in enumerate(self.students, 1):
+            for idx, student in enumerate(self.book.students(), 1):
                 print(f"\n--- Student {idx} ---")
                 print(student)
+        if stored:
+            # Too many to list; show the grade summary and point to search
+            students, grades = self.store.summary()
+            print(f"\n📥 {students} bulk-ingested students in {self.store.folder} (search them by roll number):")
+            print("🎓 " + "  ".join(f"{grade}: {count}" for grade, count in grades.items()))
 
     def search_student(self, roll_no):
-        """Search for a student by roll number."""
-        found = [s for s in self.students if s.roll_no == roll_no]
-        if found:
+        """Search for a student by roll number, in the gradebook and then the bulk store."""
+        student = self.book.student(roll_no)
+        if student is None and self.store:
+            student = self.store.student(roll_no)
+        if student:
             print("\n🎯 Student Found:")
-            print(found[0])
+            print(student)
         else:
             print("❌ Student not found.")
 
+    def subject_statistics(self, subject):
+        """Show the ranking, percentiles and score histogram of one subject."""
+        if subject not in self.book.subject_index and self.store:
+            self.stored_subject_statistics(subject)
+            return
+        try:
+            ranks = self.book.ranks(subject)
+            percentiles = self.book.percentiles(subject)
+            counts, edges = self.book.histogram(subject)
+        except KeyError as e:
+            print(f"❌ {e}")
+            return
+
+        scores = self.book.scores(subject)
+        taken = np.flatnonzero(~np.isnan(scores))
+        print(f"\n🏆 Top students in {subject}:")
+        for row in taken[np.argsort(ranks[taken], kind="stable")][:10]:
+            print(f"#{int(ranks[row])} {self.book.names[row]} ({self.book.roll_numbers[row]}): "
+                  f"{scores[row]:g} - percentile {percentiles[row]:.1f}")
+
+        print("\n📊 Score distribution:")
+        for count, low, high in zip(counts, edges[:-1], edges[1:]):
+            print(f"{low:>5.0f}-{high:<5.0f} {'█' * int(40 * count / max(counts.max(), 1))} {count}")
+
+    def stored_subject_statistics(self, subject):
+        """Ranking and score histogram of one subject from the bulk-ingested marks."""
+        scores = self.store.subject_scores(subject)
+        if scores.empty:
+            print(f"❌ No marks for subject '{subject}'.")
+            return
+        ranks = scores.rank(method="min", ascending=False)
+        percentiles = scores.rank(method="max", pct=True) * 100
+        print(f"\n🏆 Top students in {subject} (bulk-ingested):")
+        names = pd.Series(self.store.names[self.store.index.get_indexer(scores.index)], index=scores.index)
+        for roll_no in ranks.sort_values(kind="stable").index[:10]:
+            print(f"#{int(ranks[roll_no])} {names[roll_no]} ({roll_no}): "
+                  f"{scores[roll_no]:g} - percentile {percentiles[roll_no]:.1f}")
+
+        counts, edges = np.histogram(scores.to_numpy(), bins=10, range=(0, 100))
+        print("\n📊 Score distribution:")
+        for count, low, high in zip(counts, edges[:-1], edges[1:]):
+            print(f"{low:>5.0f}-{high:<5.0f} {'█' * int(40 * count / max(counts.max(), 1))} {count}")
+
+    def ingest_marks(self, path):
+        """Stream a large marks CSV into the MarkStore and show the grade summary."""
+        try:
+            store = MarkStore()
+            accepted, rejected = store.ingest_csv(path)
+        except Exception as e:
+            print(f"❌ Error ingesting marks: {e}")
+            return
+        self.store = store
+        students, grades = store.summary()
+        print(f"📥 Ingested {accepted} marks ({rejected} rejected) for {students} students.")
+        print("🎓 " + "  ".join(f"{grade}: {count}" for grade, count in grades.items()))
+
     def menu(self):
         # -----------------------------------------------
         # 🧭 CLI Menu Loop for User Interaction
@@ -136,8 +588,12 @@ class GradingSystem:
             print("1. Add Student")
             print("2. View All Students")
             print("3. Search Student by Roll No")
-            print("4. Exit")
-            choice = input("Choose an option (1-4): ")
+            print("4. Subject Statistics")
+            print("5. Export to Parquet")
+            print("6. Import from Parquet")
+            print("7. Bulk Ingest Marks CSV")
+            print("8. Exit")
+            choice = input("Choose an option (1-8): ")
 
             if choice == '1':
                 self.add_student()
@@ -150,12 +606,35 @@ class GradingSystem:
                 self.search_student(roll_no)
 
             elif choice == '4':
+                print(f"Subjects: {', '.join(self.book.subjects) or 'none yet'}")
+                self.subject_statistics(input("Enter subject: "))
+
+            elif choice == '5':
+                path = input("Enter Parquet file name (e.g. grades.parquet): ")
+                try:
+                    self.book.to_parquet(path)
+                    print(f"💾 Exported {self.book.size} students to {path}.")
+                except Exception as e:
+                    print(f"❌ Error exporting: {e}")
+
+            elif choice == '6':
+                path = input("Enter Parquet file name: ")
+                try:
+                    self.book.read_parquet(path)
+                    print(f"📥 Gradebook now holds {self.book.size} students.")
+                except Exception as e:
+                    print(f"❌ Error importing: {e}")
+
+            elif choice == '7':
+                self.ingest_marks(input("Enter CSV file (roll_no,name,subject,score): "))
+
+            elif choice == '8':
                 self.save_data()
                 print("💾 Student records saved. Goodbye!")
                 break
 
             else:
-                print("⚠️ Invalid option. Please choose 1-4.")
+                print("⚠️ Invalid option. Please choose 1-8.")
 
 
 # -----------------------------------------------
@@ -163,6 +642,10 @@ class GradingSystem:
 # -----------------------------------------------
 if __name__ == "__main__":
     system = GradingSystem()
-    system.menu()
+    if len(sys.argv) > 2 and sys.argv[1] == "ingest":
+        # Non-interactive bulk ingestion: python Day-23.py ingest marks.csv
+        system.ingest_marks(sys.argv[2])
+    else:
+        system.menu()
 # -----------------------------------------------
 # 🧑‍🎓 Student Grading System using OOP & File Handling
\ No newline at end of file
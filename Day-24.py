@@ -3,6 +3,180 @@
 # -----------------------------------------------
 
 import os
+import sys
+import json
+import time
+import random
+
+# -----------------------------------------------
+# 🧮 Bitboards – One 9-bit int per player
+# -----------------------------------------------
+# Square i (0-8, row by row) is bit (1 << i).
+
+FULL_BOARD = 0b111111111
+WIN_MASKS = (
+    0b000000111, 0b000111000, 0b111000000,  # rows
+    0b001001001, 0b010010010, 0b100100100,  # cols
+    0b100010001, 0b001010100,               # diagonals
+)
+MOVE_ORDER = (4, 0, 2, 6, 8, 1, 3, 5, 7)  # Centre, corners, then edges
+TABLE_FILE = "tic_tac_toe_table.json"
+REACHABLE_STATES = 5478
+
+
+def has_won(bits):
+    """True if the player's bitboard contains a full line."""
+    for mask in WIN_MASKS:
+        if bits & mask == mask:
+            return True
+    return False
+
+
+def empty_squares(occupied):
+    """Free squares of an occupied-squares mask, in search order."""
+    return [square for square in MOVE_ORDER if not occupied >> square & 1]
+
+
+# Lookup tables over all 512 masks for the hot paths
+WINNING = bytes(has_won(bits) for bits in range(FULL_BOARD + 1))
+FREE_SQUARES = tuple(tuple(empty_squares(occupied)) for occupied in range(FULL_BOARD + 1))
+
+
+def state_key(x_bits, o_bits):
+    """Pack both bitboards into one 18-bit key."""
+    return x_bits | o_bits << 9
+
+
+# -----------------------------------------------
+# 🤖 Solver – Negamax with alpha-beta and a transposition table
+# -----------------------------------------------
+
+EXACT, LOWER, UPPER = 0, 1, 2
+
+
+def negamax(me, opp, alpha, beta, cache):
+    """
+    Score the position for the side to move ('me'). A win is worth
+    10 minus the number of filled squares, so faster wins score higher
+    and slower losses score less badly; a draw is 0.
+    """
+    occupied = me | opp
+    if WINNING[opp]:
+        return -(10 - bin(occupied).count("1"))
+    if occupied == FULL_BOARD:
+        return 0
+
+    key = (me, opp)
+    entry = cache.get(key)
+    if entry is not None:
+        value, flag = entry
+        if flag == EXACT:
+            return value
+        if flag == LOWER:
+            alpha = max(alpha, value)
+        else:
+            beta = min(beta, value)
+        if alpha >= beta:
+            return value
+
+    start_alpha = alpha
+    best = -10
+    for square in FREE_SQUARES[occupied]:
+        value = -negamax(opp, me | 1 << square, -beta, -alpha, cache)
+        if value > best:
+            best = value
+            if best > alpha:
+                alpha = best
+                if alpha >= beta:
+                    break
+
+    if best <= start_alpha:
+        cache[key] = (best, UPPER)
+    elif best >= beta:
+        cache[key] = (best, LOWER)
+    else:
+        cache[key] = (best, EXACT)
+    return best
+
+
+def reachable_states():
+    """Every (x_bits, o_bits) position that can occur in a game, X moving first."""
+    seen = set()
+    stack = [(0, 0)]
+    while stack:
+        x_bits, o_bits = stack.pop()
+        key = state_key(x_bits, o_bits)
+        if key in seen:
+            continue
+        seen.add(key)
+        occupied = x_bits | o_bits
+        if WINNING[x_bits] or WINNING[o_bits] or occupied == FULL_BOARD:
+            continue
+        x_to_move = bin(x_bits).count("1") == bin(o_bits).count("1")
+        for square in FREE_SQUARES[occupied]:
+            if x_to_move:
+                stack.append((x_bits | 1 << square, o_bits))
+            else:
+                stack.append((x_bits, o_bits | 1 << square))
+    return seen
+
+
+def solve():
+    """
+    Solve every reachable position. Returns {key: (score, best square)}
+    where score is for the side to move and the square is -1 when the
+    game is already over.
+    """
+    cache = {}
+    table = {}
+    for key in reachable_states():
+        x_bits, o_bits = key & FULL_BOARD, key >> 9
+        if bin(x_bits).count("1") == bin(o_bits).count("1"):
+            me, opp = x_bits, o_bits
+        else:
+            me, opp = o_bits, x_bits
+        occupied = me | opp
+        if WINNING[opp] or WINNING[me] or occupied == FULL_BOARD:
+            table[key] = (negamax(me, opp, -10, 10, cache), -1)
+            continue
+        best_score, best_square = -11, -1
+        for square in FREE_SQUARES[occupied]:
+            score = -negamax(opp, me | 1 << square, -10, 10, cache)
+            if score > best_score:
+                best_score, best_square = score, square
+        table[key] = (best_score, best_square)
+    return table
+
+
+def load_table(path=TABLE_FILE):
+    """Load the solved table from disk, solving and saving it on first use."""
+    try:
+        with open(path, "r") as file:
+            rows = json.load(file)
+        if len(rows) == REACHABLE_STATES:
+            return {key: (score, square) for key, score, square in rows}
+    except (OSError, ValueError):
+        pass
+
+    table = solve()
+    try:
+        with open(path, "w") as file:
+            json.dump([[key, score, square] for key, (score, square) in sorted(table.items())], file)
+    except OSError as e:
+        print(f"❌ Failed to cache solver table: {e}")
+    return table
+
+
+_table = None
+
+
+def best_move(x_bits, o_bits):
+    """Perfect move (0-8) for whoever is to move, or -1 if the game is over."""
+    global _table
+    if _table is None:
+        _table = load_table()
+    return _table[state_key(x_bits, o_bits)][1]
+
 
 # -----------------------------------------------
 # 🧩 Board Class – Represents the Game Grid
@@ -10,41 +184,321 @@ import os
 
 class Board:
     def __init__(self):
-        # Create 3x3 empty grid
-        self.grid = [' ' for _ in range(9)]
+        # One bitboard per symbol
+        self.bits = {'X': 0, 'O': 0}
+
+    @property
+    def occupied(self):
+        return self.bits['X'] | self.bits['O']
+
+    def symbol_at(self, position):
+        for symbol, bits in self.bits.items():
+            if bits >> position & 1:
+                return symbol
+        return ' '
 
     def display(self):
         """Displays the current board layout."""
         print("\n")
         for row in range(3):
-            print(" | ".join(self.grid[row*3:(row+1)*3]))
+            print(" | ".join(self.symbol_at(row * 3 + col) for col in range(3)))
             if row < 2:
                 print("--+---+--")
         print("\n")
 
     def update(self, position, symbol):
         """Updates the board with a symbol if the position is valid."""
-        if self.grid[position] == ' ':
-            self.grid[position] = symbol
-            return True
-        return False
+        bit = 1 << position
+        if self.occupied & bit:
+            return False
+        self.bits[symbol] |= bit
+        return True
 
     def is_full(self):
         """Check if the board is completely filled (draw)."""
-        return ' ' not in self.grid
+        return self.occupied == FULL_BOARD
 
     def check_winner(self, symbol):
         """Check if the given symbol has won."""
-        win_positions = [
-            (0, 1, 2), (3, 4, 5), (6, 7, 8),  # rows
-            (0, 3, 6), (1, 4, 7), (2, 5, 8),  # cols
-            (0, 4, 8), (2, 4, 6)              # diagonals
-        ]
-        return any(self.grid[i] == self.grid[j] == self.grid[k] == symbol for i, j, k in win_positions)
+        return has_won(self.bits[symbol])
+
+    def best_move(self):
+        """Perfect-play square for the side to move."""
+        return best_move(self.bits['X'], self.bits['O'])
 
     def reset(self):
         """Resets the board for a new game."""
-        self.grid = [' ' for _ in range(9)]
+        self.bits = {'X': 0, 'O': 0}
+
+
+# -----------------------------------------------
+# 🧱 MNKBoard – m×n grid with k-in-a-row
+# -----------------------------------------------
+# Cells are numbered row by row and hold 0 (empty), 1 (first player) or
+# 2 (second player). With gravity=True a move drops to the lowest free cell
+# of its column, as in Connect Four.
+
+WIN_SCORE = 10 ** 9
+
+
+class MNKBoard:
+    DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+    NEAR = 2  # Candidate moves lie within this distance of a stone
+
+    def __init__(self, width=15, height=15, k=5, gravity=False, seed=24):
+        self.width = width
+        self.height = height
+        self.k = k
+        self.gravity = gravity
+        self.size = width * height
+        self.cells = bytearray(self.size)
+        self.near = bytearray(self.size)  # Stones within NEAR of each cell
+        self.history = []
+        self.to_move = 1
+        self.winner = 0
+
+        # Zobrist keys: one random 64-bit number per (player, cell), plus side to move
+        rng = random.Random(seed)
+        self.zobrist = [None] + [[rng.getrandbits(64) for _ in range(self.size)] for _ in range(2)]
+        self.side_key = rng.getrandbits(64)
+        self.hash = 0
+
+        self.neighbours = [
+            tuple(r * width + c
+                  for r in range(max(0, row - self.NEAR), min(height, row + self.NEAR + 1))
+                  for c in range(max(0, col - self.NEAR), min(width, col + self.NEAR + 1))
+                  if (r, c) != (row, col))
+            for row in range(height) for col in range(width)
+        ]
+        # Threat weight by stones in a row (after the move) and open ends.
+        # An open line one short of k cannot be blocked, so it outweighs everything else.
+        self.weights = [[0, 10 ** count, 2 * 10 ** count] for count in range(k + 1)]
+        if k > 2:
+            self.weights[k - 1] = [0, 10 ** k, 10 ** (k + 2)]
+
+    def cell(self, row, col):
+        return row * self.width + col
+
+    def drop_cell(self, col):
+        """Lowest empty cell of a column, or -1 if the column is full."""
+        for row in range(self.height - 1, -1, -1):
+            cell = row * self.width + col
+            if not self.cells[cell]:
+                return cell
+        return -1
+
+    def is_full(self):
+        return len(self.history) == self.size
+
+    def legal_moves(self):
+        if self.gravity:
+            return [cell for cell in map(self.drop_cell, range(self.width)) if cell >= 0]
+        return [cell for cell in range(self.size) if not self.cells[cell]]
+
+    def candidate_moves(self):
+        """Legal moves worth searching: cells near existing stones."""
+        if self.gravity:
+            return self.legal_moves()
+        if not self.history:
+            return [self.cell(self.height // 2, self.width // 2)]
+        cells, near = self.cells, self.near
+        return [cell for cell in range(self.size) if near[cell] and not cells[cell]]
+
+    def play(self, cell):
+        """Place the side to move on 'cell'. Returns the winner (0 if none)."""
+        player = self.to_move
+        self.cells[cell] = player
+        self.history.append(cell)
+        self.hash ^= self.zobrist[player][cell] ^ self.side_key
+        for other in self.neighbours[cell]:
+            self.near[other] += 1
+        if self.wins_through(cell):
+            self.winner = player
+        self.to_move = 3 - player
+        return self.winner
+
+    def undo(self):
+        cell = self.history.pop()
+        player = self.cells[cell]
+        self.cells[cell] = 0
+        self.hash ^= self.zobrist[player][cell] ^ self.side_key
+        for other in self.neighbours[cell]:
+            self.near[other] -= 1
+        self.winner = 0
+        self.to_move = player
+
+    def _run(self, row, col, dr, dc, player):
+        """Stones of 'player' from (row, col) outward, and whether the end is open."""
+        cells, width, height = self.cells, self.width, self.height
+        count = 0
+        row += dr
+        col += dc
+        while 0 <= row < height and 0 <= col < width:
+            value = cells[row * width + col]
+            if value != player:
+                return count, value == 0
+            count += 1
+            row += dr
+            col += dc
+        return count, False
+
+    def wins_through(self, cell):
+        """Check only the four lines through 'cell' for k in a row."""
+        player = self.cells[cell]
+        row, col = divmod(cell, self.width)
+        for dr, dc in self.DIRECTIONS:
+            ahead, _ = self._run(row, col, dr, dc, player)
+            behind, _ = self._run(row, col, -dr, -dc, player)
+            if 1 + ahead + behind >= self.k:
+                return True
+        return False
+
+    def threat(self, cell, player):
+        """How good an empty cell is for 'player': line lengths and open ends it would make."""
+        row, col = divmod(cell, self.width)
+        k, weights = self.k, self.weights
+        score = 0
+        for dr, dc in self.DIRECTIONS:
+            ahead, open_ahead = self._run(row, col, dr, dc, player)
+            behind, open_behind = self._run(row, col, -dr, -dc, player)
+            count = 1 + ahead + behind
+            if count >= k:
+                return WIN_SCORE
+            score += weights[count][open_ahead + open_behind]
+        return score
+
+    def display(self):
+        symbols = ".XO"
+        print("\n    " + " ".join(f"{col + 1:>2}" for col in range(self.width)))
+        for row in range(self.height):
+            line = " ".join(f"{symbols[self.cells[row * self.width + col]]:>2}" for col in range(self.width))
+            print(f"{row + 1:>3} {line}")
+        print()
+
+
+# -----------------------------------------------
+# 🧠 MNKSearch – Iterative deepening with a Zobrist-keyed table
+# -----------------------------------------------
+
+class _SearchTimeout(Exception):
+    pass
+
+
+class MNKSearch:
+    """
+    Negamax with alpha-beta, deepened one ply at a time until the time
+    limit. Positions are cached in a fixed-size table indexed by the
+    Zobrist hash, so memory stays bounded however long the game runs.
+    """
+
+    def __init__(self, board, time_limit=0.08, table_bits=18, beam=10):
+        self.board = board
+        self.time_limit = time_limit
+        self.beam = beam  # Moves searched per node, best-looking first
+        self.table = [None] * (1 << table_bits)
+        self.mask = (1 << table_bits) - 1
+        self.deadline = 0
+        self.nodes = 0
+
+    def _scored_moves(self):
+        """[(ordering score, my threat, their threat, cell)] for candidate moves, best first."""
+        board = self.board
+        me, opp = board.to_move, 3 - board.to_move
+        scored = []
+        for cell in board.candidate_moves():
+            mine, theirs = board.threat(cell, me), board.threat(cell, opp)
+            scored.append((mine + theirs, mine, theirs, cell))
+        scored.sort(reverse=True)
+        return scored
+
+    def _negamax(self, depth, alpha, beta):
+        self.nodes += 1
+        if time.perf_counter() > self.deadline:
+            raise _SearchTimeout
+        board = self.board
+        if board.winner:
+            return -(WIN_SCORE + depth)  # The previous move won; earlier losses are worse
+        if board.is_full():
+            return 0
+
+        slot = board.hash & self.mask
+        entry = self.table[slot]
+        table_move = -1
+        if entry is not None and entry[0] == board.hash:
+            _, stored_depth, value, flag, table_move = entry
+            if stored_depth >= depth:
+                if flag == EXACT:
+                    return value
+                if flag == LOWER:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value
+
+        scored = self._scored_moves()
+        my_best = max(mine for _, mine, _, _ in scored)
+        if my_best >= WIN_SCORE:
+            return WIN_SCORE + depth - 1  # Win with this move
+        blocks = [cell for _, _, theirs, cell in scored if theirs >= WIN_SCORE]
+        if len(blocks) > 1:
+            return -(WIN_SCORE + depth - 2)  # Cannot stop both
+        if blocks:
+            # Forced reply: search it even at the horizon
+            moves = blocks
+            depth = max(depth, 1)
+        elif depth == 0:
+            # Static evaluation: the side to move gets the next stone
+            their_best = max(theirs for _, _, theirs, _ in scored)
+            return my_best - their_best // 2
+        else:
+            moves = [cell for _, _, _, cell in scored[:self.beam]]
+        if table_move in moves:
+            moves.remove(table_move)
+            moves.insert(0, table_move)
+
+        start_alpha = alpha
+        best, best_move = -2 * WIN_SCORE, moves[0]
+        for cell in moves:
+            board.play(cell)
+            try:
+                value = -self._negamax(depth - 1, -beta, -alpha)
+            finally:
+                board.undo()
+            if value > best:
+                best, best_move = value, cell
+                if best > alpha:
+                    alpha = best
+                    if alpha >= beta:
+                        break
+
+        flag = UPPER if best <= start_alpha else LOWER if best >= beta else EXACT
+        self.table[slot] = (board.hash, depth, best, flag, best_move)
+        return best
+
+    def choose_move(self):
+        """Best move found within the time limit."""
+        board = self.board
+        self.deadline = time.perf_counter() + self.time_limit
+        self.nodes = 0
+        scored = self._scored_moves()
+        if scored[0][1] >= WIN_SCORE or len(scored) == 1:
+            return scored[0][3]
+        for _, _, theirs, cell in scored:
+            if theirs >= WIN_SCORE:
+                return cell  # Block a win in one
+
+        best_move = scored[0][3]
+        remaining = board.size - len(board.history)
+        for depth in range(1, remaining + 1):
+            try:
+                value = self._negamax(depth, -2 * WIN_SCORE, 2 * WIN_SCORE)
+            except _SearchTimeout:
+                break
+            best_move = self.table[board.hash & self.mask][4]
+            if abs(value) >= WIN_SCORE:
+                break  # Forced result found
+        return best_move
 
 
 # -----------------------------------------------
@@ -52,9 +506,10 @@ class Board:
 # -----------------------------------------------
 
 class Player:
-    def __init__(self, name, symbol):
+    def __init__(self, name, symbol, is_computer=False):
         self.name = name
         self.symbol = symbol
+        self.is_computer = is_computer
 
 
 # -----------------------------------------------
@@ -68,13 +523,22 @@ class Game:
 
     def get_player_input(self):
         """Take player names and assign symbols."""
-        print("🎮 Welcome to 2-Player Tic-Tac-Toe!\n")
+        print("🎮 Welcome to Tic-Tac-Toe!\n")
         name1 = input("Enter name for Player 1 (X): ")
-        name2 = input("Enter name for Player 2 (O): ")
-        self.players = [Player(name1, 'X'), Player(name2, 'O')]
+        vs_computer = input("Play against the computer? (y/n): ").lower() == 'y'
+        if vs_computer:
+            self.players = [Player(name1, 'X'), Player("Computer", 'O', is_computer=True)]
+        else:
+            name2 = input("Enter name for Player 2 (O): ")
+            self.players = [Player(name1, 'X'), Player(name2, 'O')]
 
     def take_turn(self, player):
         """Prompt the player for a valid move."""
+        if player.is_computer:
+            pos = self.board.best_move()
+            self.board.update(pos, player.symbol)
+            print(f"🤖 {player.name} ({player.symbol}) plays position {pos + 1}.")
+            return
         while True:
             try:
                 pos = int(input(f"{player.name} ({player.symbol}), choose your position (1-9): ")) - 1
@@ -131,11 +595,126 @@ class Game:
             print("👋 Thanks for playing Tic-Tac-Toe!")
 
 
+# -----------------------------------------------
+# ⏱️ Benchmark – AI move latency and self-play
+# -----------------------------------------------
+
+def benchmark(games=1000000):
+    """Time AI moves and play many games of the perfect player against a random one."""
+    start = time.perf_counter()
+    load_table()
+    print(f"Table ready ({REACHABLE_STATES} states) in {time.perf_counter() - start:.3f}s")
+
+    board = Board()
+    board.update(0, 'X')
+    calls = 100000
+    start = time.perf_counter()
+    for _ in range(calls):
+        board.best_move()
+    print(f"AI move: {(time.perf_counter() - start) / calls * 1e6:.2f} µs")
+
+    # Hot loop works on raw bitboards and the solved table
+    table = _table
+    rng = random.Random(24)
+    results = {"ai": 0, "random": 0, "draw": 0}
+    start = time.perf_counter()
+    for game in range(games):
+        ai_is_x = game % 2 == 0  # Alternate who starts
+        x_bits = o_bits = 0
+        x_turn = True
+        while True:
+            occupied = x_bits | o_bits
+            if x_turn == ai_is_x:
+                square = table[x_bits | o_bits << 9][1]
+            else:
+                square = rng.choice(FREE_SQUARES[occupied])
+            if x_turn:
+                x_bits |= 1 << square
+                mover = x_bits
+            else:
+                o_bits |= 1 << square
+                mover = o_bits
+            if WINNING[mover]:
+                results["ai" if x_turn == ai_is_x else "random"] += 1
+                break
+            if x_bits | o_bits == FULL_BOARD:
+                results["draw"] += 1
+                break
+            x_turn = not x_turn
+    elapsed = time.perf_counter() - start
+    print(f"{games:,} games in {elapsed:.2f}s ({games / elapsed:,.0f} games/s): "
+          f"AI won {results['ai']:,}, random won {results['random']:,}, drawn {results['draw']:,}")
+
+
+def benchmark_mnk(width=15, height=15, k=5, gravity=False):
+    """Let the m,n,k AI play itself and report the time per move."""
+    board = MNKBoard(width, height, k, gravity)
+    search = MNKSearch(board)
+    times = []
+    while not board.winner and not board.is_full():
+        start = time.perf_counter()
+        cell = search.choose_move()
+        times.append(time.perf_counter() - start)
+        board.play(cell)
+    board.display()
+    result = f"{'XO'[board.winner - 1]} wins" if board.winner else "draw"
+    print(f"{width}x{height}, k={k}{' with gravity' if gravity else ''}: {result} after {len(times)} moves, "
+          f"mean {sum(times) / len(times) * 1000:.1f} ms, max {max(times) * 1000:.1f} ms per move")
+
+
+# -----------------------------------------------
+# 🕹️ m,n,k Game – Human vs AI on any board size
+# -----------------------------------------------
+
+def play_mnk(width=15, height=15, k=5, gravity=False):
+    """Play X against the AI on an m×n board with k-in-a-row."""
+    board = MNKBoard(width, height, k, gravity)
+    search = MNKSearch(board)
+    print(f"🎮 {width}x{height} board, {k} in a row wins. You are X.")
+    while True:
+        board.display()
+        if board.to_move == 1:
+            try:
+                if gravity:
+                    cell = board.drop_cell(int(input(f"Column (1-{width}): ")) - 1)
+                else:
+                    row, col = (int(part) - 1 for part in input("Row and column (e.g. 8 8): ").split())
+                    cell = board.cell(row, col) if 0 <= row < height and 0 <= col < width else -1
+            except ValueError:
+                print("⚠️ Invalid input.")
+                continue
+            if cell < 0 or board.cells[cell]:
+                print("⚠️ That move is not available.")
+                continue
+        else:
+            cell = search.choose_move()
+            row, col = divmod(cell, width)
+            print(f"🤖 Computer plays {row + 1} {col + 1}.")
+        if board.play(cell):
+            board.display()
+            print("🎉 You won!" if board.winner == 1 else "🤖 The computer won.")
+            break
+        if board.is_full():
+            board.display()
+            print("😮 It's a draw!")
+            break
+
+
 # -----------------------------------------------
 # 🚀 Program Entry Point
 # -----------------------------------------------
 if __name__ == "__main__":
-    game = Game()
-    game.play()
+    if len(sys.argv) > 1 and sys.argv[1] == "bench":
+        benchmark(int(sys.argv[2]) if len(sys.argv) > 2 else 1000000)
+    elif len(sys.argv) > 1 and sys.argv[1] == "bench-mnk":
+        benchmark_mnk()
+        benchmark_mnk(7, 6, 4, gravity=True)
+    elif len(sys.argv) > 1 and sys.argv[1] == "mnk":
+        # python Day-24.py mnk [width height k [gravity]]
+        sizes = [int(arg) for arg in sys.argv[2:5]] or [15, 15, 5]
+        play_mnk(*sizes, gravity=len(sys.argv) > 5 and sys.argv[5] == "gravity")
+    else:
+        game = Game()
+        game.play()
 # -----------------------------------------------
 # End of Tic-Tac-Toe Program
\ No newline at end of file
@@ -4,6 +4,208 @@
 
 import random
 import os
+import sys
+import time
+from math import log2
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+FALLBACK_ORDER = "etaoinshrdlcumwfgypbvkjxqz"  # When no dictionary word fits
+DICTIONARY_PATHS = ("words.txt", "/usr/share/dict/words")
+CACHE_MIN_CANDIDATES = 256  # Only remember decisions for large candidate sets
+COMPACT_RATIO = 8  # Re-index when under 1/8 of the indexed words remain
+MAX_CACHED_GROUPS = 4096  # Re-indexed word sets kept for reuse across games
+
+
+# -----------------------------------------------
+# 📚 WordIndex - Dictionary indexed by length and letter position
+# -----------------------------------------------
+# Each group holds the words of one length. A set of words is an int
+# bitmask over the group (bit i = words[i]), so filtering is just AND/XOR.
+
+def load_words(path=None):
+    """Read one word per line, keeping lowercase a-z words only (deduplicated)."""
+    paths = [path] if path else [p for p in DICTIONARY_PATHS if os.path.exists(p)]
+    if not paths:
+        raise FileNotFoundError("No dictionary found. Pass a word list file (one word per line).")
+    with open(paths[0], "r", encoding="utf-8", errors="ignore") as file:
+        words = {line.strip().lower() for line in file}
+    return sorted(word for word in words if word.isascii() and word.isalpha())
+
+
+def _bits_to_int(indices, size):
+    """Build an int bitmask with the given bit positions set."""
+    bits = bytearray((size + 7) // 8)
+    for i in indices:
+        bits[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(bits, "little")
+
+
+class WordGroup:
+    """All dictionary words of one length with per-letter bitmasks."""
+
+    def __init__(self, words):
+        self.words = words
+        self.length = len(words[0])
+        self.full = (1 << len(words)) - 1
+
+        positions = {}
+        for i, word in enumerate(words):
+            for pos, letter in enumerate(word):
+                positions.setdefault((letter, pos), []).append(i)
+
+        # at[letter][pos]: words with 'letter' at 'pos'; contains[letter]: anywhere
+        self.at = {letter: [0] * self.length for letter in ALPHABET}
+        self.contains = dict.fromkeys(ALPHABET, 0)
+        for (letter, pos), indices in positions.items():
+            mask = _bits_to_int(indices, len(words))
+            self.at[letter][pos] = mask
+            self.contains[letter] |= mask
+
+
+class WordIndex:
+    def __init__(self, words):
+        by_length = {}
+        for word in words:
+            by_length.setdefault(len(word), []).append(word)
+        self.groups = {length: WordGroup(group) for length, group in by_length.items()}
+        self.decisions = {}  # (length, guess history) -> next guess
+        self.subgroups = {}  # (length, guess history) -> re-indexed remaining words
+
+    def __len__(self):
+        return sum(len(group.words) for group in self.groups.values())
+
+
+# -----------------------------------------------
+# 🧠 HangmanSolver - Guesses by maximum expected information gain
+# -----------------------------------------------
+
+class HangmanSolver:
+    def __init__(self, index):
+        self.index = index
+
+    def start(self, length):
+        """Begin a new game for a word of 'length' letters."""
+        self.length = length
+        self.group = self.index.groups.get(length)
+        self.candidates = self.group.full if self.group else 0
+        self.pattern = [None] * length
+        self.guessed = set()
+        self.history = []
+
+    def candidate_words(self):
+        words = self.group.words if self.group else []
+        cand = self.candidates
+        result = []
+        while cand:
+            low = cand & -cand
+            result.append(words[low.bit_length() - 1])
+            cand ^= low
+        return result
+
+    def _pattern_sizes(self, subset, letter, unknown):
+        """Sizes of the groups 'subset' splits into by where 'letter' appears."""
+        at = self.group.at[letter]
+        active = [at[pos] for pos in unknown if subset & at[pos]]  # Positions where it can be
+        sizes = []
+        stack = [(subset, 0)]
+        while stack:
+            words, i = stack.pop()
+            if i == len(active):
+                sizes.append(words.bit_count())
+                continue
+            inside = words & active[i]
+            outside = words ^ inside
+            if inside:
+                stack.append((inside, i + 1))
+            if outside:
+                stack.append((outside, i + 1))
+        return sizes
+
+    def next_guess(self):
+        """The letter whose answer is expected to tell us the most."""
+        cand = self.candidates
+        total = cand.bit_count()
+        if total == 0:
+            # The word is not in the dictionary: fall back to letter frequency
+            return next(letter for letter in FALLBACK_ORDER if letter not in self.guessed)
+        if total == 1:
+            word = self.group.words[cand.bit_length() - 1]
+            return next(letter for letter in word if letter not in self.guessed)
+
+        key = (self.length, tuple(self.history))
+        if total >= CACHE_MIN_CANDIDATES and key in self.index.decisions:
+            return self.index.decisions[key]
+
+        unknown = [pos for pos, letter in enumerate(self.pattern) if letter is None]
+        contains = self.group.contains
+        best, best_score = None, None
+        for letter in ALPHABET:
+            if letter in self.guessed:
+                continue
+            hits = cand & contains[letter]
+            if not hits:
+                continue
+            # Expected information = log2(total) - sum(n log2 n) / total, so
+            # minimise sum(n log2 n); break ties by the chance of a hit
+            misses = total - hits.bit_count()
+            spread = sum(n * log2(n) for n in self._pattern_sizes(hits, letter, unknown))
+            if misses:
+                spread += misses * log2(misses)
+            score = (spread, misses)
+            if best_score is None or score < best_score:
+                best, best_score = letter, score
+
+        if total >= CACHE_MIN_CANDIDATES:
+            self.index.decisions[key] = best
+        return best
+
+    def update(self, letter, positions):
+        """Apply the answer to a guess: the 0-based positions where 'letter' appears."""
+        positions = tuple(sorted(positions))
+        self.guessed.add(letter)
+        self.history.append((letter, positions))
+        if not self.group:
+            return
+        cand = self.candidates
+        if positions:
+            at = self.group.at[letter]
+            for pos, known in enumerate(self.pattern):
+                if known is not None:
+                    continue
+                if pos in positions:
+                    cand &= at[pos]
+                else:
+                    cand ^= cand & at[pos]
+            for pos in positions:
+                self.pattern[pos] = letter
+        else:
+            cand ^= cand & self.group.contains[letter]
+        self.candidates = cand
+
+        # Once few words are left, re-index just those so the masks stay narrow
+        remaining = cand.bit_count()
+        if remaining and remaining * COMPACT_RATIO < len(self.group.words):
+            key = (self.length, tuple(self.history))
+            group = self.index.subgroups.get(key)
+            if group is None:
+                group = WordGroup(self.candidate_words())
+                if remaining >= CACHE_MIN_CANDIDATES and len(self.index.subgroups) < MAX_CACHED_GROUPS:
+                    self.index.subgroups[key] = group
+            self.group = group
+            self.candidates = group.full
+
+    def solve(self, word):
+        """Play 'word' to the end. Returns (guesses, wrong guesses)."""
+        self.start(len(word))
+        guesses = misses = 0
+        while None in self.pattern:
+            letter = self.next_guess()
+            positions = [pos for pos, char in enumerate(word) if char == letter]
+            self.update(letter, positions)
+            guesses += 1
+            if not positions:
+                misses += 1
+        return guesses, misses
 
 # -----------------------------------------------
 # 🧑 Player Class - Tracks player data
@@ -26,6 +228,7 @@ class HangmanGame:
         self.word_list = ['elephant', 'python', 'laptop', 'programming', 'hangman']
         self.max_attempts = 6
         self.word_to_guess = ""
+        self.letter_positions = {}  # letter -> indexes in the word
         self.guessed_letters = set()
         self.display_word = ""
         self.player = None
@@ -34,6 +237,9 @@ class HangmanGame:
         """Select a random word from the list."""
         self.word_to_guess = random.choice(self.word_list)
         self.display_word = "_" * len(self.word_to_guess)
+        self.letter_positions = {}
+        for idx, char in enumerate(self.word_to_guess):
+            self.letter_positions.setdefault(char, []).append(idx)
 
     def get_player(self):
         """Get player name from input and create Player object."""
@@ -43,9 +249,8 @@ class HangmanGame:
     def update_display_word(self, letter):
         """Update the word display with correctly guessed letters."""
         updated = list(self.display_word)
-        for idx, char in enumerate(self.word_to_guess):
-            if char == letter:
-                updated[idx] = letter
+        for idx in self.letter_positions.get(letter, ()):
+            updated[idx] = letter
         self.display_word = "".join(updated)
 
     def display_status(self):
@@ -71,7 +276,7 @@ class HangmanGame:
         self.guessed_letters.add(guess)
 
         # Check if guess is correct
-        if guess in self.word_to_guess:
+        if guess in self.letter_positions:
             self.update_display_word(guess)
             print("✅ Correct!")
         else:
@@ -118,11 +323,66 @@ class HangmanGame:
         self.save_result()
 
 
+# -----------------------------------------------
+# 🤖 Solver Mode & Benchmark
+# -----------------------------------------------
+
+def run_solver(index):
+    """Think of a word; the solver guesses and you report where each letter appears."""
+    solver = HangmanSolver(index)
+    length = int(input("How many letters in your word? "))
+    solver.start(length)
+    while None in solver.pattern:
+        letter = solver.next_guess()
+        answer = input(f"🤖 Is there a '{letter}'? Enter its positions (e.g. 1 4), or press Enter for none: ")
+        try:
+            positions = [int(part) - 1 for part in answer.split()]
+        except ValueError:
+            print("⚠️ Please enter numbers only.")
+            continue
+        if any(pos < 0 or pos >= length or solver.pattern[pos] for pos in positions):
+            print("⚠️ Those positions are not available.")
+            continue
+        solver.update(letter, positions)
+        print("🔤 Word:", " ".join(letter or "_" for letter in solver.pattern))
+        print(f"📚 {solver.candidates.bit_count()} dictionary words still fit.")
+    print(f"🎉 Your word is '{''.join(solver.pattern)}' ({len(solver.history)} guesses).")
+
+
+def benchmark(path=None):
+    """Solve every word in the dictionary and report guesses and time per game."""
+    start = time.perf_counter()
+    words = load_words(path)
+    index = WordIndex(words)
+    print(f"Indexed {len(index):,} words in {time.perf_counter() - start:.2f}s")
+
+    solver = HangmanSolver(index)
+    total_guesses = total_misses = won = 0
+    start = time.perf_counter()
+    for word in words:
+        guesses, misses = solver.solve(word)
+        total_guesses += guesses
+        total_misses += misses
+        won += misses < 6
+    elapsed = time.perf_counter() - start
+    print(f"Solved {len(words):,} words in {elapsed:.1f}s ({elapsed / len(words) * 1000:.3f} ms per game)")
+    print(f"Average guesses {total_guesses / len(words):.2f}, wrong guesses {total_misses / len(words):.2f}, "
+          f"won within 6 misses {won / len(words):.1%}")
+
+
 # -----------------------------------------------
 # 🚀 Program Entry Point
 # -----------------------------------------------
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "bench":
+        # python Day-25.py bench [words.txt]
+        benchmark(sys.argv[2] if len(sys.argv) > 2 else None)
+        sys.exit()
+    if len(sys.argv) > 1 and sys.argv[1] == "solve":
+        run_solver(WordIndex(load_words(sys.argv[2] if len(sys.argv) > 2 else None)))
+        sys.exit()
+
     while True:
         game = HangmanGame()
         game.play()
@@ -2,70 +2,241 @@
 # ⏱️ Stopwatch (CLI Version) using OOP & File Handling
 # -----------------------------------------------
 
+import sys
 import time
+import atexit
 import datetime
+import functools
+import threading
+from array import array
+from math import ceil
+
+LAP_CAPACITY = 4096   # Laps kept in the ring buffer
+LOG_BATCH_SIZE = 64   # Log lines held before a write
+
+# -----------------------------------------------
+# 🔁 LapHistory – Fixed-size ring buffer of durations
+# -----------------------------------------------
+
+class LapHistory:
+    """Keeps the most recent 'capacity' durations (in ns) in a preallocated array."""
+
+    def __init__(self, capacity=LAP_CAPACITY):
+        self.capacity = capacity
+        self.data = array('q', bytes(8 * capacity))
+        self.count = 0  # Total laps ever recorded
+
+    def append(self, nanoseconds):
+        self.data[self.count % self.capacity] = nanoseconds
+        self.count += 1
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    def values(self):
+        """Stored durations, oldest first."""
+        if self.count <= self.capacity:
+            return self.data[:self.count]
+        cut = self.count % self.capacity
+        return self.data[cut:] + self.data[:cut]
+
+    def clear(self):
+        self.count = 0
+
+    def summary(self):
+        """count/min/mean/p99/max (ns) over the stored durations, or None if empty."""
+        values = sorted(self.values())
+        if not values:
+            return None
+        return {
+            "count": len(values),
+            "min": values[0],
+            "mean": sum(values) // len(values),
+            "p99": values[ceil(0.99 * len(values)) - 1],
+            "max": values[-1],
+        }
+
+
+# -----------------------------------------------
+# 📝 LogWriter – Buffered log that writes in batches
+# -----------------------------------------------
+
+class LogWriter:
+    """Appends lines to a file opened once, writing them 'batch_size' at a time."""
+
+    def __init__(self, path, batch_size=LOG_BATCH_SIZE):
+        self.path = path
+        self.batch_size = batch_size
+        self.pending = []
+        self.file = None
+        atexit.register(self.close)
+
+    def write(self, line):
+        self.pending.append(line)
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self.pending:
+            return
+        try:
+            if self.file is None:
+                self.file = open(self.path, "a", buffering=1 << 16)
+            self.file.writelines(self.pending)
+            self.file.flush()
+        except Exception as e:
+            print(f"❌ Error writing to log file: {e}")
+        self.pending.clear()
+
+    def close(self):
+        self.flush()
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
 
 # -----------------------------------------------
 # 🧩 Stopwatch Class – Handles Stopwatch Logic
 # -----------------------------------------------
 
 class Stopwatch:
-    def __init__(self):
-        self.start_time = None
-        self.end_time = None
+    """
+    Monotonic stopwatch on perf_counter_ns with laps and splits.
+
+    Also a profiling timer: 'with sw:' or '@sw' records each block or call
+    as one lap, so sw.summary() gives min/mean/p99 over recent samples.
+    """
+
+    def __init__(self, name="stopwatch", log_path="stopwatch_log.txt", capacity=LAP_CAPACITY):
+        self.name = name
+        self.laps = LapHistory(capacity)
+        self.log = LogWriter(log_path) if log_path else None
         self.running = False
-        self.elapsed_time = 0.0  # in seconds
+        self.start_ns = 0      # When the current run started
+        self.lap_start_ns = 0  # When the current lap started
+        self.elapsed_ns = 0    # Time from completed runs
+        self.lock = threading.Lock()  # Guards laps and elapsed_ns when recording
+        self._local = threading.local()  # Per-thread stack of 'with' block start times
 
     def start(self):
-        """Start the stopwatch."""
-        if not self.running:
-            self.start_time = time.time()
-            self.running = True
-            print("⏳ Stopwatch started...")
-        else:
-            print("⚠️ Stopwatch is already running.")
+        """Start the stopwatch. Returns False if it was already running."""
+        if self.running:
+            return False
+        self.start_ns = self.lap_start_ns = time.perf_counter_ns()
+        self.running = True
+        return True
 
     def stop(self):
-        """Stop the stopwatch and calculate elapsed time."""
+        """Stop the stopwatch and return the total elapsed ns, or None if it was not running."""
+        if not self.running:
+            return None
+        now = time.perf_counter_ns()
+        self.elapsed_ns += now - self.start_ns
+        self.running = False
+        self.save_log()
+        return self.elapsed_ns
+
+    def lap(self):
+        """Close the current lap and start the next one. Returns the lap time in ns."""
+        if not self.running:
+            return None
+        now = time.perf_counter_ns()
+        duration = now - self.lap_start_ns
+        self.lap_start_ns = now
+        with self.lock:
+            self.laps.append(duration)
+        return duration
+
+    def split(self):
+        """Total elapsed ns so far, without stopping or starting a lap."""
         if self.running:
-            self.end_time = time.time()
-            self.elapsed_time += self.end_time - self.start_time
-            self.running = False
-            print(f"🛑 Stopwatch stopped. Total time: {self.format_time(self.elapsed_time)}")
-            self.save_log()
-        else:
-            print("⚠️ Stopwatch is not running.")
+            return self.elapsed_ns + time.perf_counter_ns() - self.start_ns
+        return self.elapsed_ns
+
+    def record(self, nanoseconds):
+        """Add an externally measured duration as a lap."""
+        with self.lock:
+            self.laps.append(nanoseconds)
+            self.elapsed_ns += nanoseconds
 
     def reset(self):
-        """Reset the stopwatch to 0."""
-        self.start_time = None
-        self.end_time = None
+        """Reset the stopwatch to 0 and forget all laps."""
         self.running = False
-        self.elapsed_time = 0.0
-        print("🔄 Stopwatch reset.")
+        self.start_ns = self.lap_start_ns = 0
+        self.elapsed_ns = 0
+        self.laps.clear()
+
+    # Context manager: time the block as one lap. Start times are kept on a
+    # per-thread stack, so nested blocks and several threads don't clash.
+    def __enter__(self):
+        try:
+            starts = self._local.starts
+        except AttributeError:
+            starts = self._local.starts = []
+        starts.append(time.perf_counter_ns())
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.record(time.perf_counter_ns() - self._local.starts.pop())
+        return False
 
-    def format_time(self, seconds):
-        """Convert seconds to hh:mm:ss.ms format."""
-        return time.strftime("%H:%M:%S", time.gmtime(seconds)) + f".{int((seconds % 1) * 100):02d}"
+    # Decorator: time every call as one lap
+    def __call__(self, func):
+        clock, record = time.perf_counter_ns, self.record
+
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(clock() - start)
+        return timed
+
+    def summary(self):
+        return self.laps.summary()
+
+    @staticmethod
+    def format_time(nanoseconds):
+        """Convert ns to hh:mm:ss.mmm format."""
+        seconds, rest = divmod(nanoseconds, 1_000_000_000)
+        return time.strftime("%H:%M:%S", time.gmtime(seconds)) + f".{rest // 1_000_000:03d}"
+
+    @staticmethod
+    def format_duration(nanoseconds):
+        """Short human-readable duration for profiling output."""
+        if nanoseconds < 1_000:
+            return f"{nanoseconds} ns"
+        if nanoseconds < 1_000_000:
+            return f"{nanoseconds / 1_000:.2f} µs"
+        if nanoseconds < 1_000_000_000:
+            return f"{nanoseconds / 1_000_000:.2f} ms"
+        return f"{nanoseconds / 1_000_000_000:.3f} s"
+
+    def summary_text(self):
+        stats = self.summary()
+        if stats is None:
+            return f"{self.name}: no laps recorded"
+        fmt = self.format_duration
+        return (f"{self.name}: {stats['count']} laps, min {fmt(stats['min'])}, mean {fmt(stats['mean'])}, "
+                f"p99 {fmt(stats['p99'])}, max {fmt(stats['max'])}")
 
     def save_log(self):
-        """Save the timing log to a file with timestamp."""
-        try:
-            with open("stopwatch_log.txt", "a") as file:
-                now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                duration = self.format_time(self.elapsed_time)
-                file.write(f"[{now}] Duration: {duration}\n")
-        except Exception as e:
-            print(f"❌ Error writing to log file: {e}")
+        """Queue the timing log line (with timestamp) on the buffered writer."""
+        if self.log is None:
+            return
+        now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.log.write(f"[{now}] Duration: {self.format_time(self.elapsed_ns)}\n")
+
+    def log_summary(self):
+        """Queue the lap summary on the buffered writer."""
+        if self.log is not None:
+            now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            self.log.write(f"[{now}] {self.summary_text()}\n")
 
     def status(self):
         """Display current status of the stopwatch."""
-        if self.running:
-            current = time.time()
-            elapsed = self.elapsed_time + (current - self.start_time)
-        else:
-            elapsed = self.elapsed_time
-        print(f"⏲️ Elapsed Time: {self.format_time(elapsed)}")
+        print(f"⏲️ Elapsed Time: {self.format_time(self.split())}")
 
 
 # -----------------------------------------------
@@ -79,9 +250,12 @@ def main():
 🕹️ STOPWATCH CLI - COMMANDS
 ----------------------------
 start  -> Start the stopwatch
+lap    -> Record a lap
+split  -> Show time since start without stopping
 stop   -> Stop the stopwatch
 reset  -> Reset the stopwatch
 status -> Show current elapsed time
+laps   -> Show lap min/mean/p99
 exit   -> Exit the program
 """)
 
@@ -89,27 +263,84 @@ exit   -> Exit the program
         cmd = input("📥 Enter command: ").strip().lower()
 
         if cmd == "start":
-            sw.start()
+            if sw.start():
+                print("⏳ Stopwatch started...")
+            else:
+                print("⚠️ Stopwatch is already running.")
+        elif cmd == "lap":
+            duration = sw.lap()
+            if duration is None:
+                print("⚠️ Stopwatch is not running.")
+            else:
+                print(f"🏁 Lap {sw.laps.count}: {sw.format_time(duration)} (split {sw.format_time(sw.split())})")
+        elif cmd == "split":
+            print(f"⏱️ Split: {sw.format_time(sw.split())}")
         elif cmd == "stop":
-            sw.stop()
+            total = sw.stop()
+            if total is None:
+                print("⚠️ Stopwatch is not running.")
+            else:
+                print(f"🛑 Stopwatch stopped. Total time: {sw.format_time(total)}")
         elif cmd == "reset":
             sw.reset()
+            print("🔄 Stopwatch reset.")
         elif cmd == "status":
             sw.status()
+        elif cmd == "laps":
+            print(f"📊 {sw.summary_text()}")
         elif cmd == "exit":
             if sw.running:
-                sw.stop()  # auto stop before exiting
+                print(f"🛑 Stopwatch stopped. Total time: {sw.format_time(sw.stop())}")  # auto stop before exiting
+            sw.log.close()
             print("👋 Exiting stopwatch. Goodbye!")
             break
         else:
             print("⚠️ Invalid command. Please try again.")
 
+
+# -----------------------------------------------
+# 🏎️ Benchmark – Overhead of the profiling timer
+# -----------------------------------------------
+
+def benchmark(iterations=1_000_000):
+    """Compare a bare loop with the same loop timed by 'with' and by the decorator."""
+    def work():
+        return None
+
+    start = time.perf_counter_ns()
+    for _ in range(iterations):
+        work()
+    bare = time.perf_counter_ns() - start
+
+    sw = Stopwatch("with-block", log_path=None)
+    start = time.perf_counter_ns()
+    for _ in range(iterations):
+        with sw:
+            work()
+    with_block = time.perf_counter_ns() - start
+    print(sw.summary_text())
+
+    timed_work = Stopwatch("decorator", log_path=None)
+    timed = timed_work(work)
+    start = time.perf_counter_ns()
+    for _ in range(iterations):
+        timed()
+    decorated = time.perf_counter_ns() - start
+    print(timed_work.summary_text())
+
+    print(f"Overhead per timed call: with-block {(with_block - bare) / iterations:.0f} ns, "
+          f"decorator {(decorated - bare) / iterations:.0f} ns")
+
+
 # -----------------------------------------------
 # 🚀 Program Entry Point
 # -----------------------------------------------
 
 if __name__ == "__main__":
-    main()
-    
+    if len(sys.argv) > 1 and sys.argv[1] == "bench":
+        benchmark()
+    else:
+        main()
+
 # -----------------------------------------------
-# 🕰️ Stopwatch CLI Program
\ No newline at end of file
+# 🕰️ Stopwatch CLI Program
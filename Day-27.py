@@ -2,52 +2,211 @@
 # ⏰ Digital Clock (CLI) using OOP & File Handling
 # -----------------------------------------------
 
+import io
+import sys
 import time
+import random
 import datetime
 import os
 
+FLUSH_EVERY = 60  # Ticks between log flushes
+
+# -----------------------------------------------
+# ⏲️ TickScheduler – Sleeps to absolute boundaries
+# -----------------------------------------------
+
+class TickScheduler:
+    """
+    Ticks every 'interval' seconds on boundaries fixed at start-up
+    (start + n * interval on the monotonic clock). Each sleep aims at
+    the next boundary, so late wake-ups never add up into drift.
+    """
+
+    def __init__(self, interval=1.0, clock=time.monotonic, sleep=time.sleep, offset=0.0):
+        self.interval = interval
+        self.clock = clock
+        self.sleep = sleep
+        self.start = clock() + offset
+        self.ticks = 0   # Boundaries reached
+        self.missed = 0  # Boundaries skipped because we woke up too late
+
+    def next_deadline(self):
+        return self.start + self.ticks * self.interval
+
+    def wait(self):
+        """Sleep until the next boundary. Returns how late (in seconds) we woke up."""
+        deadline = self.next_deadline()
+        remaining = deadline - self.clock()
+        if remaining > 0:
+            self.sleep(remaining)
+        late = self.clock() - deadline
+        # If a whole interval was lost (e.g. the machine slept), skip to the current one
+        behind = int(late // self.interval)
+        if behind > 0:
+            self.missed += behind
+            self.ticks += behind
+            late -= behind * self.interval
+        self.ticks += 1
+        return late
+
+
+# -----------------------------------------------
+# 🖥️ LineRenderer – Redraws only what changed
+# -----------------------------------------------
+
+class LineRenderer:
+    """Keeps one line on screen, rewriting only from the first changed character."""
+
+    def __init__(self, out=None):
+        self.out = out or sys.stdout
+        self.shown = ""
+        self.bytes_written = 0
+
+    def render(self, text):
+        shown = self.shown
+        if text == shown:
+            return
+        first = 0
+        limit = min(len(text), len(shown))
+        while first < limit and text[first] == shown[first]:
+            first += 1
+        chunk = "\b" * (len(shown) - first) + text[first:]  # Back up to the first change
+        if len(text) < len(shown):
+            extra = len(shown) - len(text)
+            chunk += " " * extra + "\b" * extra  # Blank out leftovers
+        self.out.write(chunk)
+        self.out.flush()
+        self.bytes_written += len(chunk)
+        self.shown = text
+
+
 # -----------------------------------------------
 # 🕒 DigitalClock Class – Core Clock Logic
 # -----------------------------------------------
 
 class DigitalClock:
-    def __init__(self, log_to_file=False):
+    def __init__(self, log_to_file=False, log_path="digital_clock_log.txt", out=None):
         """
         Initialize the digital clock.
         :param log_to_file: If True, log each timestamp to a file
         """
         self.log_to_file = log_to_file
+        self.log_path = log_path
+        self.log_file = None
+        self.out = out or sys.stdout
         self.running = False
 
     def get_current_time(self):
         """Get current system time in hh:mm:ss format."""
         return datetime.datetime.now().strftime("%H:%M:%S")
 
-    def display_time(self):
+    def display_time(self, max_ticks=None):
         """Continuously display the clock in the terminal."""
         self.running = True
-        print("\n🕒 Real-Time Digital Clock - Press Ctrl+C to exit\n")
+        print("\n🕒 Real-Time Digital Clock - Press Ctrl+C to exit\n", file=self.out)
+        self.out.write("⏰ ")
+
+        # Tick just after each wall-clock second changes
+        scheduler = TickScheduler(offset=1.0 - time.time() % 1.0)
+        renderer = LineRenderer(self.out)
+        if self.log_to_file:
+            self.open_log()
 
         try:
-            while self.running:
+            while self.running and (max_ticks is None or scheduler.ticks < max_ticks):
                 current_time = self.get_current_time()
-                print(f"\r⏰ {current_time}", end='', flush=True)  # Print on same line
+                renderer.render(current_time)
 
                 if self.log_to_file:
                     self.save_log(current_time)
+                    if scheduler.ticks % FLUSH_EVERY == 0:
+                        self.flush_log()
 
-                time.sleep(1)  # Wait for 1 second
+                scheduler.wait()
         except KeyboardInterrupt:
             self.running = False
-            print("\n\n👋 Clock stopped by user.")
+            print("\n\n👋 Clock stopped by user.", file=self.out)
+        finally:
+            self.close_log()
+
+    def open_log(self):
+        """Open the log file once, buffered, for the whole run."""
+        try:
+            self.log_file = open(self.log_path, "a", buffering=1 << 16)
+        except Exception as e:
+            print(f"\n❌ Error opening log file: {e}", file=self.out)
+            self.log_to_file = False
 
     def save_log(self, timestamp):
-        """Save the timestamp to a log file."""
+        """Save the timestamp to the log buffer."""
         try:
-            with open("digital_clock_log.txt", "a") as file:
-                file.write(f"{timestamp}\n")
+            self.log_file.write(f"{timestamp}\n")
         except Exception as e:
-            print(f"\n❌ Error writing to log file: {e}")
+            print(f"\n❌ Error writing to log file: {e}", file=self.out)
+
+    def flush_log(self):
+        if self.log_file is not None:
+            self.log_file.flush()
+
+    def close_log(self):
+        if self.log_file is not None:
+            self.log_file.close()
+            self.log_file = None
+
+
+# -----------------------------------------------
+# 🧪 Drift Benchmark – 24 simulated hours on a fake clock
+# -----------------------------------------------
+
+class FakeClock:
+    """Simulated monotonic clock: sleeping oversleeps a little, work takes time."""
+
+    def __init__(self, seed=27, oversleep=0.002, work=0.001):
+        self.now = 0.0
+        self.rng = random.Random(seed)
+        self.oversleep = oversleep  # Max extra time a sleep takes
+        self.work = work            # Max time one redraw takes
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds + self.rng.uniform(0, self.oversleep)
+
+    def do_work(self):
+        self.now += self.rng.uniform(0, self.work)
+
+
+def benchmark(hours=24):
+    """Compare a fixed sleep(1) loop with the scheduler over a simulated day."""
+    ticks = int(hours * 3600)
+
+    naive = FakeClock()
+    for _ in range(ticks):
+        naive.do_work()
+        naive.sleep(1.0)
+    print(f"sleep(1) loop:  {ticks:,} ticks took {naive.now:,.1f}s, drift {naive.now - ticks:+.3f}s")
+
+    fake = FakeClock()
+    scheduler = TickScheduler(clock=fake.monotonic, sleep=fake.sleep)
+    worst = 0.0
+    for _ in range(ticks):
+        fake.do_work()
+        worst = max(worst, scheduler.wait())
+    drift = fake.now - scheduler.next_deadline() + scheduler.interval
+    print(f"TickScheduler:  {ticks:,} ticks took {fake.now:,.1f}s, drift {drift:+.3f}s, "
+          f"worst tick {worst * 1000:.2f} ms late, {scheduler.missed} missed")
+
+    # Redraw cost: full line each second vs only the changed characters
+    out = io.StringIO()
+    renderer = LineRenderer(out)
+    start = datetime.datetime(2024, 1, 1)
+    full = 0
+    for second in range(ticks):
+        text = (start + datetime.timedelta(seconds=second)).strftime("%H:%M:%S")
+        full += len(text) + 1  # "\r" + text
+        renderer.render(text)
+    print(f"Redraw output:  {renderer.bytes_written:,} chars vs {full:,} for full redraws")
 
 
 # -----------------------------------------------
@@ -64,7 +223,7 @@ Press Ctrl+C to stop at any time.
 Would you like to log every second to a file?
 (Useful if you want a history of timestamps)
 """)
-    
+
     choice = input("Enable logging? (y/n): ").strip().lower()
     log_enabled = choice == 'y'
 
@@ -78,6 +237,9 @@ Would you like to log every second to a file?
 # -----------------------------------------------
 
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 1 and sys.argv[1] == "bench":
+        benchmark()
+    else:
+        main()
 # -----------------------------------------------
-# End of Digital Clock Program
\ No newline at end of file
+# End of Digital Clock Program
@@ -5,23 +5,138 @@
 # A palindrome is a word, number, phrase, or sequence that reads the same backward as forward.
 # Examples: "madam", "racecar", "121", "noon"
 
+# Usage:
+#   python Day-3.py                      -> check one phrase typed by the user
+#   python Day-3.py file.txt             -> check every line of a file ("-" reads stdin)
+#   python Day-3.py --longest file.txt   -> find the longest palindromic substring in a file
+
+import sys
+
+
 def is_palindrome(text):
     """
     This function checks if the given text is a palindrome.
-    
+    Spaces, punctuation and letter case (including Unicode case) are ignored.
+
+    Two pointers walk inwards from both ends of the string, so no cleaned
+    or reversed copy of the text is ever built.
+
     Parameters:
         text (str): The string to be checked.
-        
+
     Returns:
         bool: True if 'text' is a palindrome, False otherwise.
     """
-    # Remove spaces and convert to lowercase to make it case-insensitive and space-insensitive
-    cleaned_text = text.replace(" ", "").lower()
-    
-    # Check if the cleaned text is equal to its reverse
-    return cleaned_text == cleaned_text[::-1]
+    left, right = 0, len(text) - 1
+
+    while left < right:
+        # Skip characters that are not letters or digits
+        if not text[left].isalnum():
+            left += 1
+        elif not text[right].isalnum():
+            right -= 1
+        elif text[left].casefold() != text[right].casefold():
+            return False
+        else:
+            left += 1
+            right -= 1
+
+    return True
+
+
+def check_lines(lines):
+    """
+    Check each line from an iterable (for example an open file) one at a time.
+    Yields (line, is_palindrome) pairs, so even huge files use little memory.
+    """
+    for line in lines:
+        line = line.rstrip("\r\n")
+        yield line, is_palindrome(line)
+
+
+def longest_palindromic_substring(text):
+    """
+    Find the longest palindromic substring of 'text' using Manacher's algorithm.
+    The comparison is exact (case and punctuation matter) and runs in O(n) time.
+
+    Parameters:
+        text (str): The string to search.
+
+    Returns:
+        str: The longest palindromic substring (the first one if there is a tie).
+    """
+    n = len(text)
+    if n == 0:
+        return ""
+
+    best_start, best_length = 0, 1
+
+    # odd[i]: number of odd-length palindromes centred at i (radius + 1)
+    odd = [0] * n
+    left, right = 0, -1
+    for i in range(n):
+        k = 1 if i > right else min(odd[left + right - i], right - i + 1)
+        while i - k >= 0 and i + k < n and text[i - k] == text[i + k]:
+            k += 1
+        odd[i] = k
+        if i + k - 1 > right:
+            left, right = i - k + 1, i + k - 1
+        if 2 * k - 1 > best_length:
+            best_start, best_length = i - k + 1, 2 * k - 1
+
+    # even[i]: radius of the even-length palindrome centred between i-1 and i
+    even = [0] * n
+    left, right = 0, -1
+    for i in range(n):
+        k = 0 if i > right else min(even[left + right - i + 1], right - i + 1)
+        while i - k - 1 >= 0 and i + k < n and text[i - k - 1] == text[i + k]:
+            k += 1
+        even[i] = k
+        if i + k - 1 > right:
+            left, right = i - k, i + k - 1
+        if 2 * k > best_length or (2 * k == best_length and i - k < best_start):
+            best_start, best_length = i - k, 2 * k
+
+    return text[best_start:best_start + best_length]
+
+
+def run_batch(path):
+    """Check every line of a file (or stdin when path is "-") and print a summary."""
+    total = found = 0
+    source = sys.stdin if path == "-" else open(path, "r", encoding="utf-8")
+    try:
+        for line, result in check_lines(source):
+            total += 1
+            if result:
+                found += 1
+                print(f"✅ {line}")
+            else:
+                print(f"❌ {line}")
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+    print(f"\n📊 {found} of {total} lines are palindromes.")
+
+
+def run_longest(path):
+    """Print the longest palindromic substring of a whole file."""
+    with open(path, "r", encoding="utf-8") as file:
+        text = file.read()
+    result = longest_palindromic_substring(text)
+    print(f"🔎 Longest palindrome ({len(result)} characters):")
+    print(result)
+
 
 def main():
+    # Batch modes when a file is given on the command line
+    if len(sys.argv) > 2 and sys.argv[1] == "--longest":
+        run_longest(sys.argv[2])
+        return
+    if len(sys.argv) > 1:
+        run_batch(sys.argv[1])
+        return
+
     # Print a welcome message
     print("🔁 Palindrome Checker 🔁")
     print("------------------------")
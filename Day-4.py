@@ -3,21 +3,91 @@
 # -----------------------------------------------
 
 # This script finds all prime numbers up to a number entered by the user.
+# Primes are found with a segmented Sieve of Eratosthenes, so only one small,
+# cache-sized block of the number line is held in memory at a time.
 
-def is_prime(number):
+import os
+import sys
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import compress
+from math import gcd, isqrt
+from multiprocessing import shared_memory
+
+# Size (in numbers) of each sieve segment - 256 KB fits comfortably in CPU cache
+SEGMENT_SIZE = 1 << 18
+
+# Size of the chunks handed to each worker process by count_primes/primes_in_range
+RANGE_CHUNK = 1 << 22
+
+# Numbers below this are answered by a direct lookup in a prime table
+SMALL_TABLE_LIMIT = 1 << 16
+
+# Miller-Rabin witnesses that are proven correct for every n < 2**64
+MR_WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+
+def simple_sieve(limit):
     """
-    Function to check if a number is prime.
-    A prime number is only divisible by 1 and itself.
+    Classic Sieve of Eratosthenes on a bytearray.
+    Returns a list of all primes up to 'limit'. Used for the small "base" primes.
+    """
+    if limit < 2:
+        return []
+
+    sieve = bytearray(b"\x01") * (limit + 1)
+    sieve[0] = sieve[1] = 0
+
+    for p in range(2, isqrt(limit) + 1):
+        if sieve[p]:
+            # Cross out every multiple of p, starting at p*p
+            sieve[p * p::p] = bytes(len(range(p * p, limit + 1, p)))
+
+    return list(compress(range(limit + 1), sieve))
+
+
+def sieve_segment(low, high, base_primes):
+    """
+    Sieve one segment [low, high] of the number line.
+    Returns a bytearray where segment[i] == 1 means (low + i) is prime.
+    'base_primes' must contain every prime up to sqrt(high).
+    """
+    size = high - low + 1
+    segment = bytearray(b"\x01") * size
+    zeros = memoryview(bytes(size))  # Reused zero buffer, sliced without copying
+
+    for p in base_primes:
+        square = p * p
+        if square > high:
+            break
+        # First multiple of p inside the segment (never below p*p)
+        first = max(square, (low + p - 1) // p * p) - low
+        segment[first::p] = zeros[:len(range(first, size, p))]
+
+    # 0 and 1 are not prime
+    for n in range(low, min(2, high + 1)):
+        segment[n - low] = 0
+
+    return segment
+
+
+def iter_primes(limit, start=2, segment_size=SEGMENT_SIZE):
+    """
+    Generator that yields the primes from 'start' up to 'limit' in order.
+    Works one segment at a time, so even limits like 10**10 only need
+    a few hundred KB of memory.
     """
-    if number <= 1:
-        return False  # Numbers less than or equal to 1 are not prime
+    start = max(start, 0)
+    if limit < 2 or start > limit:
+        return
 
-    # Check divisibility from 2 to the square root of the number
-    for i in range(2, int(number ** 0.5) + 1):
-        if number % i == 0:
-            return False  # Found a factor, not prime
+    base_primes = simple_sieve(isqrt(limit))
 
-    return True  # No factors found, number is prime
+    for low in range(start, limit + 1, segment_size):
+        high = min(low + segment_size - 1, limit)
+        segment = sieve_segment(low, high, base_primes)
+        yield from compress(range(low, high + 1), segment)
 
 
 def find_primes_up_to(limit):
@@ -25,15 +95,278 @@ def find_primes_up_to(limit):
     Finds all prime numbers from 2 up to a given limit.
     Returns a list of prime numbers.
     """
-    primes = []  # List to store prime numbers
+    return list(iter_primes(limit))
+
+
+# -----------------------------------------------
+# Primality testing
+# -----------------------------------------------
+
+# Prefilter tables, built once and shared by is_prime and is_prime_many
+SMALL_PRIME_TABLE = bytearray(SMALL_TABLE_LIMIT)
+for _p in simple_sieve(SMALL_TABLE_LIMIT - 1):
+    SMALL_PRIME_TABLE[_p] = 1
+
+# Product of the primes below 300 - one gcd() replaces ~60 trial divisions
+SMALL_PRIMORIAL = 1
+for _p in simple_sieve(300):
+    SMALL_PRIMORIAL *= _p
+
+
+def _is_strong_probable_prime(n, base):
+    """Miller-Rabin round: True if odd n > 2 is a strong probable prime to 'base'."""
+    d = n - 1
+    s = (d & -d).bit_length() - 1  # Number of trailing zero bits
+    d >>= s
+
+    x = pow(base, d, n)
+    if x == 1 or x == n - 1:
+        return True
+    for _ in range(s - 1):
+        x = x * x % n
+        if x == n - 1:
+            return True
+    return False
+
+
+def _jacobi(a, n):
+    """Jacobi symbol (a/n) for odd n > 0."""
+    a %= n
+    result = 1
+    while a:
+        while a % 2 == 0:
+            a //= 2
+            if n % 8 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+
+def _is_strong_lucas_probable_prime(n):
+    """Strong Lucas test with Selfridge's parameters (the second half of BPSW)."""
+    if isqrt(n) ** 2 == n:
+        return False  # No suitable D exists for perfect squares
+
+    # Find the first D in 5, -7, 9, -11, ... with (D/n) == -1
+    D = 5
+    while True:
+        j = _jacobi(D, n)
+        if j == -1:
+            break
+        if j == 0 and abs(D) != n:
+            return False
+        D = -D - 2 if D > 0 else -D + 2
+    P, Q = 1, (1 - D) // 4
+
+    # Write n + 1 = d * 2**s with d odd
+    d = n + 1
+    s = (d & -d).bit_length() - 1
+    d >>= s
+
+    # Binary ladder computing U_d, V_d and Q**d (mod n)
+    U, V, Qk = 1, P, Q % n
+    for bit in bin(d)[3:]:
+        U = U * V % n
+        V = (V * V - 2 * Qk) % n
+        Qk = Qk * Qk % n
+        if bit == "1":
+            U, V = P * U + V, D * U + P * V
+            # Divide by 2 modulo n (n is odd, so adding n makes the value even)
+            if U & 1:
+                U += n
+            if V & 1:
+                V += n
+            U, V = (U // 2) % n, (V // 2) % n
+            Qk = Qk * Q % n
+
+    if U == 0 or V == 0:
+        return True
+    for _ in range(s - 1):
+        V = (V * V - 2 * Qk) % n
+        Qk = Qk * Qk % n
+        if V == 0:
+            return True
+    return False
+
+
+def _passes_strong_tests(n):
+    """
+    Primality test for n that already passed the small-prime prefilter.
+    Deterministic Miller-Rabin below 2**64, Baillie-PSW above it.
+    """
+    if n < 1 << 64:
+        return all(_is_strong_probable_prime(n, a) for a in MR_WITNESSES)
+    return _is_strong_probable_prime(n, 2) and _is_strong_lucas_probable_prime(n)
+
+
+def is_prime(number):
+    """
+    Function to check if a number is prime.
+    A prime number is only divisible by 1 and itself.
+
+    Small numbers are looked up in a table, larger ones are screened with
+    a gcd against the small primes and then checked with Miller-Rabin
+    (exact for numbers below 2**64) or Baillie-PSW.
+    """
+    if number < SMALL_TABLE_LIMIT:
+        return number >= 2 and SMALL_PRIME_TABLE[number] == 1
+
+    if gcd(number, SMALL_PRIMORIAL) != 1:
+        return False  # Has a small prime factor
+
+    return _passes_strong_tests(number)
+
+
+def is_prime_many(numbers):
+    """
+    Test a whole batch of numbers for primality.
+    Returns a list of booleans in the same order as 'numbers'.
+    The prefilter tables are bound once for the whole batch.
+    """
+    table = SMALL_PRIME_TABLE
+    limit = SMALL_TABLE_LIMIT
+    primorial = SMALL_PRIMORIAL
+    strong = _passes_strong_tests
+
+    results = []
+    append = results.append
+    for n in numbers:
+        if n < limit:
+            append(n >= 2 and table[n] == 1)
+        elif gcd(n, primorial) != 1:
+            append(False)
+        else:
+            append(strong(n))
+    return results
+
+
+# -----------------------------------------------
+# Multi-core range API
+# -----------------------------------------------
+
+# Base primes shared with worker processes (filled in by _init_worker)
+_worker_shm = None
+_worker_base_primes = None
+
+
+def _init_worker(shm_name, count):
+    """Attach a worker process to the shared base-prime table."""
+    global _worker_shm, _worker_base_primes
+    _worker_shm = shared_memory.SharedMemory(name=shm_name)
+    _worker_base_primes = _worker_shm.buf[:count * 8].cast("Q")
+
+
+def _count_chunk(low, high):
+    """Worker task: count the primes in [low, high]."""
+    return sieve_segment(low, high, _worker_base_primes).count(1)
+
+
+def _primes_chunk(low, high):
+    """Worker task: return the primes in [low, high] as a compact array."""
+    segment = sieve_segment(low, high, _worker_base_primes)
+    return array("Q", compress(range(low, high + 1), segment))
+
+
+def _split_range(lo, hi, chunk):
+    """Split [lo, hi] into consecutive (low, high) pieces of at most 'chunk' numbers."""
+    return [(low, min(low + chunk - 1, hi)) for low in range(lo, hi + 1, chunk)]
+
+
+def _run_chunks(task, lo, hi, workers):
+    """
+    Sieve [lo, hi] chunk by chunk with 'task' and yield the results in order.
+    The base primes are computed once and shared with every worker
+    through shared memory instead of being pickled for each task.
+    """
+    base_primes = simple_sieve(isqrt(hi))
+    chunks = _split_range(lo, hi, RANGE_CHUNK)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(chunks))
+
+    # Small jobs are not worth starting processes for
+    if workers <= 1:
+        global _worker_base_primes
+        _worker_base_primes = base_primes
+        for low, high in chunks:
+            yield task(low, high)
+        return
+
+    table = array("Q", base_primes)
+    shm = shared_memory.SharedMemory(create=True, size=max(len(table) * 8, 1))
+    try:
+        shm.buf[:len(table) * 8] = table.tobytes()
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(shm.name, len(table))) as executor:
+            lows = [low for low, _ in chunks]
+            highs = [high for _, high in chunks]
+            yield from executor.map(task, lows, highs)
+    finally:
+        shm.close()
+        shm.unlink()
 
-    for num in range(2, limit + 1):
-        if is_prime(num):
-            primes.append(num)
 
+def count_primes(lo, hi, workers=None):
+    """
+    Count the primes in the range [lo, hi] using 'workers' processes
+    (defaults to the number of CPU cores).
+    """
+    lo = max(lo, 2)
+    if hi < lo:
+        return 0
+    return sum(_run_chunks(_count_chunk, lo, hi, workers))
+
+
+def primes_in_range(lo, hi, workers=None):
+    """
+    Return a sorted list of the primes in the range [lo, hi]
+    using 'workers' processes (defaults to the number of CPU cores).
+    """
+    lo = max(lo, 2)
+    if hi < lo:
+        return []
+    primes = []
+    for chunk in _run_chunks(_primes_chunk, lo, hi, workers):
+        primes.extend(chunk)
     return primes
 
 
+def benchmark():
+    """
+    Compare the old is_prime loop with count_primes on one and many cores.
+    Run with:  python Day-4.py bench
+    """
+    print("⏱️ Prime counting benchmark")
+    print("---------------------------")
+
+    lo, width = 10**7, 10**5
+    start = time.perf_counter()
+    expected = sum(1 for n in range(lo, lo + width + 1) if is_prime(n))
+    loop_time = time.perf_counter() - start
+    start = time.perf_counter()
+    assert count_primes(lo, lo + width, workers=1) == expected
+    sieve_time = time.perf_counter() - start
+    print(f"[{lo}, {lo}+{width}]  is_prime loop: {loop_time:.3f}s  "
+          f"sieve: {sieve_time:.3f}s  ({loop_time / sieve_time:.0f}x faster)")
+
+    lo, width = 10**12, 10**8
+    cores = os.cpu_count() or 1
+    single = None
+    for workers in sorted({1, 2, 4, cores}):
+        if workers > cores:
+            continue
+        start = time.perf_counter()
+        count = count_primes(lo, lo + width, workers=workers)
+        elapsed = time.perf_counter() - start
+        single = single or elapsed
+        print(f"[{lo}, {lo}+{width}]  workers={workers}: {count} primes in "
+              f"{elapsed:.2f}s  (speed-up {single / elapsed:.2f}x)")
+
+
 def main():
     """
     Main function to handle user input and display results.
@@ -59,6 +392,9 @@ def main():
         print("❌ Invalid input! Please enter a valid number.")
 
 
-# Run the main function
+# Run the main function (or the benchmark with "python Day-4.py bench")
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 1 and sys.argv[1] == "bench":
+        benchmark()
+    else:
+        main()
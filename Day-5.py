@@ -3,6 +3,66 @@
 # -----------------------------------------------
 
 # Description: This program generates the Fibonacci sequence up to a specified number of terms.
+# Single terms are computed with the "fast doubling" method in O(log n) steps,
+# and whole sequences can be streamed lazily with iter_fibonacci().
+
+import sys
+import time
+from itertools import islice
+
+
+def fib(n):
+    """
+    Return the n-th Fibonacci number (fib(0) = 0, fib(1) = 1) using fast doubling:
+        F(2k)   = F(k) * (2*F(k+1) - F(k))
+        F(2k+1) = F(k)**2 + F(k+1)**2
+    Only O(log n) big-integer multiplications are needed.
+    """
+    if n < 0:
+        raise ValueError("n must be a non-negative integer")
+
+    a, b = 0, 1  # F(k), F(k+1) for the bits of n read so far
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)  # F(2k)
+        d = a * a + b * b    # F(2k+1)
+        if bit == "1":
+            a, b = d, c + d
+        else:
+            a, b = c, d
+    return a
+
+
+def fib_mod(n, m):
+    """
+    Return fib(n) % m using fast doubling, keeping every step reduced modulo m
+    so the numbers never grow beyond m**2.
+    """
+    if n < 0:
+        raise ValueError("n must be a non-negative integer")
+    if m <= 0:
+        raise ValueError("m must be a positive integer")
+
+    a, b = 0, 1 % m
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a) % m
+        d = (a * a + b * b) % m
+        if bit == "1":
+            a, b = d, (c + d) % m
+        else:
+            a, b = c, d
+    return a
+
+
+def iter_fibonacci():
+    """
+    Lazily yield the Fibonacci sequence 0, 1, 1, 2, 3, 5, ...
+    Only the last two terms are kept in memory.
+    """
+    a, b = 0, 1
+    while True:
+        yield a
+        a, b = b, a + b
+
 
 def generate_fibonacci(n_terms):
     """
@@ -19,27 +79,43 @@ def generate_fibonacci(n_terms):
     if n_terms <= 0:
         return []
 
-    # If only 1 term is requested, return [0]
-    elif n_terms == 1:
-        return [0]
+    # Take the first n_terms values from the lazy generator
+    return list(islice(iter_fibonacci(), n_terms))
 
-    # If 2 terms are requested, return [0, 1]
-    elif n_terms == 2:
-        return [0, 1]
 
-    # Start the sequence with the first two Fibonacci numbers
-    fib_sequence = [0, 1]
+def benchmark():
+    """
+    Time fib(n) for n = 10**3 .. 10**7 and compare with the old list-building loop.
+    Run with:  python Day-5.py bench
+    """
+    print("=== Fibonacci Benchmark ===")
+    for exponent in range(3, 8):
+        n = 10 ** exponent
+
+        start = time.perf_counter()
+        value = fib(n)
+        doubling_time = time.perf_counter() - start
 
-    # Loop to generate the remaining terms
-    for i in range(2, n_terms):
-        next_term = fib_sequence[i - 1] + fib_sequence[i - 2]
-        fib_sequence.append(next_term)  # Add the next term to the list
+        line = f"n = 10^{exponent}: fast doubling {doubling_time:.4f}s ({value.bit_length()} bits)"
 
-    return fib_sequence
+        # The old approach builds the whole list, so only try it for small n
+        if n <= 10 ** 5:
+            start = time.perf_counter()
+            sequence = [0, 1]
+            for i in range(2, n + 1):
+                sequence.append(sequence[i - 1] + sequence[i - 2])
+            loop_time = time.perf_counter() - start
+            assert sequence[n] == value
+            line += f", list loop {loop_time:.4f}s"
+
+        print(line)
 
 
 # === Program Entry Point ===
-if __name__ == "__main__":
+if __name__ == "__main__" and len(sys.argv) > 1 and sys.argv[1] == "bench":
+    benchmark()
+
+elif __name__ == "__main__":
     print("=== Fibonacci Sequence Generator ===")
     
     try:
@@ -2,24 +2,251 @@
 # 📌 World Count Tool
 # -----------------------------------------------
 
-# Importing the necessary library
+# Usage:
+#   python Day-8.py                              -> count the words in a line you type
+#   python Day-8.py book.txt --top 10            -> stream a file of any size
+#   python Day-8.py big.txt --workers 8          -> split a big file across processes
+#   python Day-8.py --bench 1024                 -> benchmark on a generated 1 GB corpus
+
+# Importing the necessary libraries
+import argparse
+import codecs
+import heapq
+import os
+import random
 import re
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+# A word is any run of non-space characters that contains a letter or digit
+WORD_PATTERN = re.compile(r"\S*\w\S*")
+PUNCTUATION_PATTERN = re.compile(r"[^\w\s]")
+WORD_CHARACTER = re.compile(r"\w")
+SPACE = re.compile(r"\s")
+WHITESPACE = " \t\n\r\f\v"
+
+# Number of bytes read from the file at a time
+CHUNK_SIZE = 1 << 20
+
+# An unfinished word longer than this is counted, but no longer kept in memory
+MAX_WORD_LENGTH = 1 << 20
+
 
 def count_words(text):
     """
     Function to count words in a given text.
-    It removes special characters and counts the number of words.
+    Punctuation is ignored, so "hello, world!" counts as two words.
+    """
+    # Count matches directly instead of building a cleaned copy of the text
+    return sum(1 for _ in WORD_PATTERN.finditer(text))
+
+
+def count_chunks(chunks):
+    """
+    Count words, lines and characters over an iterable of text chunks.
+    A word cut in half at the end of a chunk is carried over and joined
+    with the start of the next chunk. A "word" longer than MAX_WORD_LENGTH
+    is counted but left out of the frequencies, so memory stays bounded.
+    Returns (word_count, newline_count, character_count, Counter of words).
+    """
+    words = newlines = characters = 0
+    frequencies = Counter()
+    carry = []  # Pieces of the possibly unfinished word at the end of the text so far
+    carry_length = 0
+    long_word = None  # For an oversized unfinished word: whether it has a word character
+
+    for chunk in chunks:
+        characters += len(chunk)
+        newlines += chunk.count("\n")
+
+        # Cut after the last whitespace of this chunk; only the new chunk is searched
+        cut = max(map(chunk.rfind, WHITESPACE)) + 1
+        head, tail = chunk[:cut], chunk[cut:]
+
+        if cut:
+            if long_word is not None:
+                # The oversized word ends at the first whitespace of this chunk
+                end = SPACE.search(head).start()
+                words += long_word or bool(WORD_CHARACTER.search(head, 0, end))
+                head = head[end:]
+                long_word = None
+
+            # Only this chunk is cleaned at a time, never the whole file
+            tokens = PUNCTUATION_PATTERN.sub("", "".join(carry) + head).lower().split()
+            words += len(tokens)
+            frequencies.update(tokens)
+            carry, carry_length = [], 0
+
+        # Keep the trailing, possibly unfinished word for the next chunk
+        if long_word is not None:
+            long_word = long_word or bool(WORD_CHARACTER.search(tail))
+            continue
+        carry.append(tail)
+        carry_length += len(tail)
+        if carry_length > MAX_WORD_LENGTH:
+            long_word = any(WORD_CHARACTER.search(piece) for piece in carry)
+            carry, carry_length = [], 0
+
+    # Whatever is left over is the last word of the input
+    words += bool(long_word)
+    tokens = PUNCTUATION_PATTERN.sub("", "".join(carry)).lower().split()
+    words += len(tokens)
+    frequencies.update(tokens)
+
+    return words, newlines, characters, frequencies
+
+
+def _read_range(path, start, end):
+    """Yield the decoded text of bytes [start, end) of a UTF-8 file, one chunk at a time."""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    with open(path, "rb") as file:
+        file.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            data = file.read(min(CHUNK_SIZE, remaining))
+            if not data:
+                break
+            remaining -= len(data)
+            yield decoder.decode(data)
+    yield decoder.decode(b"", final=True)
+
+
+def _count_range(path, start, end):
+    """Worker task: count one byte range of a file."""
+    return count_chunks(_read_range(path, start, end))
+
+
+def _split_file(path, parts):
+    """
+    Split a file into about 'parts' byte ranges that each end just after a newline,
+    so no word or multi-byte character is cut between two workers.
+    """
+    size = os.path.getsize(path)
+    bounds = [0]
+    with open(path, "rb") as file:
+        for i in range(1, parts):
+            file.seek(max(size * i // parts, bounds[-1]))
+            file.readline()  # Move forward to the end of the current line
+            position = file.tell()
+            if position >= size:
+                break
+            if position > bounds[-1]:
+                bounds.append(position)
+    bounds.append(size)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def count_file(path, top=10, workers=1):
+    """
+    Stream a file of any size and return a dictionary with its word, line,
+    character and unique-word counts plus the 'top' most frequent words.
+    With workers > 1 the file is split across processes and the results merged.
     """
-    cleaned_text = re.sub(r"[^\w\s]", "", text)  # Remove punctuation
-    words = cleaned_text.split()  # Split text into words
-    return len(words)  # Return total word count
+    ranges = _split_file(path, max(workers, 1))
+
+    if len(ranges) <= 1:
+        results = [_count_range(path, start, end) for start, end in ranges]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            paths = [path] * len(ranges)
+            results = list(executor.map(_count_range, paths,
+                                        [start for start, _ in ranges],
+                                        [end for _, end in ranges]))
+
+    words = newlines = characters = 0
+    frequencies = Counter()
+    for part_words, part_newlines, part_characters, part_frequencies in results:
+        words += part_words
+        newlines += part_newlines
+        characters += part_characters
+        frequencies.update(part_frequencies)
+
+    # A last line without a trailing newline still counts as a line
+    lines = newlines
+    size = os.path.getsize(path)
+    if size:
+        with open(path, "rb") as file:
+            file.seek(size - 1)
+            if file.read(1) != b"\n":
+                lines += 1
+
+    return {
+        "words": words,
+        "lines": lines,
+        "characters": characters,
+        "unique_words": len(frequencies),
+        # nlargest keeps a heap of only 'top' items instead of sorting everything
+        "top_words": heapq.nlargest(top, frequencies.items(), key=lambda item: item[1]),
+    }
+
+
+def print_report(path, stats):
+    """Display the statistics returned by count_file."""
+    print(f"\n📜 Word Count Report for {path}")
+    print(f"📝 Total words: {stats['words']}")
+    print(f"📄 Lines: {stats['lines']}")
+    print(f"🔤 Characters: {stats['characters']}")
+    print(f"🧩 Unique words: {stats['unique_words']}")
+    if stats["top_words"]:
+        print("\n🏆 Most frequent words:")
+        for rank, (word, count) in enumerate(stats["top_words"], 1):
+            print(f"{rank:>3}. {word} ({count})")
+
+
+def benchmark(size_mb):
+    """Generate a random corpus of 'size_mb' megabytes and time count_file on it."""
+    vocabulary = [f"word{i}" for i in range(50000)] + ["the", "and", "of", "to", "a", "in"]
+    line_words = 12
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "corpus.txt")
+        print(f"⚙️ Generating a {size_mb} MB corpus...")
+        target = size_mb * 1024 * 1024
+        written = 0
+        with open(path, "w", encoding="utf-8") as file:
+            while written < target:
+                block = "\n".join(" ".join(random.choices(vocabulary, k=line_words))
+                                  for _ in range(10000)) + "\n"
+                file.write(block)
+                written += len(block)
+
+        cores = os.cpu_count() or 1
+        for workers in sorted({1, cores}):
+            start = time.perf_counter()
+            stats = count_file(path, top=10, workers=workers)
+            elapsed = time.perf_counter() - start
+            print(f"workers={workers}: {stats['words']} words in {elapsed:.2f}s "
+                  f"({size_mb / elapsed:.1f} MB/s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Count words in text or files.")
+    parser.add_argument("file", nargs="?", help="text file to count (omit to type text)")
+    parser.add_argument("--top", type=int, default=10, help="number of frequent words to show")
+    parser.add_argument("--workers", type=int, default=1, help="number of processes to use")
+    parser.add_argument("--bench", type=int, metavar="MB", help="benchmark on a generated corpus")
+    args = parser.parse_args()
+
+    if args.bench:
+        benchmark(args.bench)
+        return
+
+    if args.file:
+        print_report(args.file, count_file(args.file, args.top, args.workers))
+        return
+
+    # 🔹 Getting user input
+    print("\n📜 Word Count Tool")
+    text = input("✍️  Enter your text: ")
+
+    # 🔹 Calculating word count
+    word_count = count_words(text)
 
-# 🔹 Getting user input
-print("\n📜 Word Count Tool")
-text = input("✍️  Enter your text: ")
+    # ✅ Displaying the result
+    print(f"\n📝 Total words: {word_count}")
 
-# 🔹 Calculating word count
-word_count = count_words(text)
 
-# ✅ Displaying the result
-print(f"\n📝 Total words: {word_count}")
+if __name__ == "__main__":
+    main()